@@ -289,6 +289,17 @@ def create_database():
             ),
         )
 
+    # Cria os índices usados pelas consultas do SQL Runner e atualiza as estatísticas
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_customers_postal_name "
+        "ON customers(postal_code, client_name COLLATE NOCASE)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_customers_city_state "
+        "ON customers(client_city, client_state)"
+    )
+    cursor.execute("ANALYZE")
+
     # Commit e fecha
     conn.commit()
 
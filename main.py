@@ -187,7 +187,9 @@ class ConversationalCLI:
 
                 from tools.sql_runner import get_client_profile
 
-                response = get_client_profile(client_id=client_id)
+                response = get_client_profile(
+                    client_id=client_id, fields=["client_name"]
+                )
 
                 # Check if client was found (result will be None if not found)
                 if not response.get("result"):
@@ -477,7 +479,9 @@ class ConversationalCLI:
             console.print(f"[dim]Validando Client ID {self.client_id}...[/dim]")
             from tools.sql_runner import get_client_profile
 
-            response = get_client_profile(client_id=self.client_id)
+            response = get_client_profile(
+                client_id=self.client_id, fields=["client_name"]
+            )
 
             # Check if client was found (result will be None if not found)
             if not response.get("result"):
@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the test suite.
+
+Nothing here talks to the network: Gemini models and embeddings are replaced
+by small deterministic fakes, and HTTP calls are patched per test.
+"""
+
+import re
+import sys
+import zlib
+from pathlib import Path
+from typing import List
+
+import pytest
+from langchain_core.embeddings import Embeddings
+
+# Make the project packages (tools, utils) importable without installation
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def hashed_vector(text: str, dim: int = 32) -> List[float]:
+    """Bag-of-words vector: texts sharing words get similar embeddings."""
+    vector = [0.01] * dim
+    for word in re.findall(r"[a-z]+", text.lower()):
+        vector[zlib.crc32(word.encode()) % dim] += 1.0
+    return vector
+
+
+class FakeEmbeddings(Embeddings):
+    """Deterministic stand-in for GoogleGenerativeAIEmbeddings."""
+
+    task_type = None
+
+    def __init__(self, *args, **kwargs):
+        self.calls = 0
+
+    def embed_documents(self, texts: List[str], **kwargs) -> List[List[float]]:
+        self.calls += 1
+        return [hashed_vector(text) for text in texts]
+
+    def embed_query(self, text: str, **kwargs) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+@pytest.fixture(autouse=True)
+def fake_api_key(monkeypatch):
+    """Satisfy API key checks without a real key."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
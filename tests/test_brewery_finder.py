@@ -0,0 +1,127 @@
+"""Tests for search, history filtering and caching in tools.brewery_finder."""
+
+import json
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import urllib3
+
+from tools.brewery_finder import BreweryFinder
+
+BREWERIES = [
+    {"id": str(i), "name": name, "brewery_type": "micro", "city": "San Diego"}
+    for i, name in enumerate(
+        [
+            "Stone Brewing",
+            "Ballast Point Brewing",
+            "Modern Times Beer",
+            "AleSmith Brewing Company",
+            "Stone Brewing Tap Room",
+            "Pizza Port",
+        ]
+    )
+]
+
+
+def fake_request(method, url, **kwargs):
+    """Answer like OpenBreweryDB, honouring by_name and pagination."""
+    params = dict(parse_qsl(urlsplit(url).query))
+    name = params.get("by_name", "").replace("_", " ")
+    data = [b for b in BREWERIES if name in b["name"].lower()]
+    page, per_page = int(params.get("page", 1)), int(params.get("per_page", 50))
+    data = data[(page - 1) * per_page : page * per_page]
+    return SimpleNamespace(status=200, data=json.dumps(data).encode(), headers={})
+
+
+@pytest.fixture
+def api():
+    with mock.patch.object(
+        urllib3.PoolManager, "request", side_effect=fake_request
+    ) as request:
+        yield request
+
+
+@pytest.fixture
+def finder():
+    return BreweryFinder()
+
+
+def names(result):
+    return [b["brewery_name"] for b in result["data"]]
+
+
+def test_history_excludes_variants_but_not_other_venues(finder, api):
+    result = finder.search_breweries(
+        city="San Diego", brewery_history=["Stone Brewing Co.", "Port"]
+    )
+
+    assert result["status"] == "success"
+    assert "Stone Brewing" not in names(result)
+    assert "Stone Brewing Tap Room" in names(result)
+    assert "Pizza Port" in names(result)
+
+
+def test_all_in_history(finder, api):
+    result = finder.search_breweries(
+        city="San Diego", brewery_history=[b["name"] for b in BREWERIES]
+    )
+
+    assert result["status"] == "NO_NEW_BREWERIES"
+
+
+def test_name_search_ranks_best_match_first(finder, api):
+    result = finder.search_breweries(brewery_name="Stone", filter_history=False)
+
+    assert names(result) == ["Stone Brewing", "Stone Brewing Tap Room"]
+
+
+def test_limit_is_applied_after_history_filter(finder, api):
+    result = finder.search_breweries(
+        city="San Diego", brewery_history=["Stone Brewing"], limit=2
+    )
+
+    assert len(result["data"]) == 2
+    assert "Stone Brewing" not in names(result)
+
+
+def test_result_cache_returns_copies(finder, api):
+    first = finder.search_breweries(city="San Diego", filter_history=False)
+    first["data"][0]["brewery_name"] = "Mutated"
+    first["metadata"]["total_found"] = -1
+
+    second = finder.search_breweries(city="San Diego", filter_history=False)
+
+    assert api.call_count == 1
+    assert second["data"][0]["brewery_name"] == "Stone Brewing"
+    assert second["metadata"]["total_found"] == len(BREWERIES)
+
+
+def test_api_error_is_reported_and_not_cached(finder):
+    error = urllib3.exceptions.MaxRetryError(None, "url", reason=Exception("down"))
+    with mock.patch.object(urllib3.PoolManager, "request", side_effect=error):
+        assert finder.search_breweries(city="San Diego")["status"] == "API_ERROR"
+
+    with mock.patch.object(
+        urllib3.PoolManager, "request", side_effect=fake_request
+    ) as request:
+        assert finder.search_breweries(city="San Diego")["status"] == "success"
+        assert request.call_count == 1
+
+
+def test_invalid_brewery_type_skips_the_api(finder, api):
+    result = finder.search_breweries(city="San Diego", brewery_type="castle")
+
+    assert result["status"] == "NO_BREWERIES"
+    api.assert_not_called()
+
+
+def test_arrow_output_matches_dict_output(finder, api):
+    pa = pytest.importorskip("pyarrow")
+
+    table = finder.search_breweries(city="San Diego", output="arrow")["data"]
+    rows = finder.search_breweries(city="San Diego")["data"]
+
+    assert isinstance(table, pa.Table)
+    assert table.to_pylist() == rows
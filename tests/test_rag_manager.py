@@ -0,0 +1,107 @@
+"""Tests for the FAISS summary cache in utils.rag_manager."""
+
+import pytest
+
+import utils.rag_manager as rag_manager
+from conftest import FakeEmbeddings
+
+
+@pytest.fixture(autouse=True)
+def fake_embeddings(monkeypatch):
+    monkeypatch.setattr(rag_manager, "GoogleGenerativeAIEmbeddings", FakeEmbeddings)
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "faiss_index")
+
+
+@pytest.fixture
+def manager(index_path):
+    manager = rag_manager.RAGManager(index_path=index_path)
+    yield manager
+    manager.close()
+
+
+def fill(manager):
+    for name in ["Stone Brewing", "Brooklyn Brewery", "Sierra Nevada"]:
+        manager.add_to_cache(name, f"https://{name.split()[0].lower()}.com", name)
+
+
+def test_search_by_brewery_name(manager):
+    fill(manager)
+
+    result, status = manager.search_cache("Brooklyn", brewery_name="Brooklyn Brewery")
+
+    assert status == "CACHE_HIT"
+    assert result["brewery_name"] == "Brooklyn Brewery"
+    assert manager.search_cache("Zed", brewery_name="Zed Works")[1] == "CACHE_MISS"
+
+
+def test_brewery_name_matches_by_containment(manager):
+    fill(manager)
+
+    result, status = manager.search_cache("Stone", brewery_name="stone")
+
+    assert status == "CACHE_HIT"
+    assert result["brewery_name"] == "Stone Brewing"
+
+
+def test_batch_search_matches_single_search(manager):
+    fill(manager)
+    names = ["Stone Brewing", "Zed Works", "Sierra Nevada"]
+
+    batch = manager.search_cache_batch(names, names)
+
+    assert batch == [manager.search_cache(n, brewery_name=n) for n in names]
+    assert [status for _, status in batch] == ["CACHE_HIT", "CACHE_MISS", "CACHE_HIT"]
+
+
+def test_flush_and_reload_round_trip(manager, index_path):
+    fill(manager)
+    assert manager.flush(force=True)
+
+    reloaded = rag_manager.RAGManager(index_path=index_path)
+    try:
+        for name in ["Stone Brewing", "Brooklyn Brewery", "Sierra Nevada"]:
+            result, status = reloaded.search_cache(name, brewery_name=name)
+            assert status == "CACHE_HIT"
+            assert result["summary"] == name
+        assert reloaded.get_cache_stats()["total_entries"] == 3
+    finally:
+        reloaded.close()
+
+
+def test_close_writes_pending_entries(index_path):
+    manager = rag_manager.RAGManager(index_path=index_path)
+    manager.add_to_cache("Stone Brewing", "https://stone.com", "Stone summary")
+    manager.close()
+
+    reloaded = rag_manager.RAGManager(index_path=index_path)
+    try:
+        assert reloaded.search_cache("Stone", brewery_name="Stone Brewing")[1] == (
+            "CACHE_HIT"
+        )
+    finally:
+        reloaded.close()
+
+
+def test_update_replaces_entry_across_reload(manager, index_path):
+    fill(manager)
+    manager.update_cache_entry("Stone Brewing", "https://stone.com", "New summary")
+    manager.flush(force=True)
+
+    reloaded = rag_manager.RAGManager(index_path=index_path)
+    try:
+        result, _ = reloaded.search_cache("Stone", brewery_name="Stone Brewing")
+        assert result["summary"] == "New summary"
+        assert reloaded.get_cache_stats()["total_entries"] == 3
+    finally:
+        reloaded.close()
+
+
+def test_submitted_entries_are_searchable(manager):
+    future = manager.submit_to_cache("Pizza Port", "https://pizzaport.com", "Pizza")
+
+    assert future.result(timeout=10)
+    assert manager.search_cache("Pizza", brewery_name="Pizza Port")[1] == "CACHE_HIT"
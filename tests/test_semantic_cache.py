@@ -0,0 +1,65 @@
+"""Tests for utils.semantic_cache."""
+
+from conftest import hashed_vector
+from utils.semantic_cache import SemanticCache, extract_literals
+
+
+def test_hits_paraphrases_in_scope():
+    cache = SemanticCache(hashed_vector, threshold=0.9)
+    cache.set("Which breweries did I buy from?", "SQL", scope="client-1")
+
+    assert cache.get("which breweries did I buy from", scope="client-1") == "SQL"
+    assert cache.get("Which breweries did I buy from?", scope="client-2") is None
+
+
+def test_other_scopes_do_not_crowd_out_a_hit():
+    cache = SemanticCache(hashed_vector, threshold=0.9)
+    for i in range(2 * SemanticCache.SEARCH_K):
+        cache.set("How many orders in total?", f"other-{i}", scope=f"client-{i}")
+    cache.set("How many orders in total?", "mine", scope="me")
+
+    assert cache.get("How many orders in total?", scope="me") == "mine"
+
+
+def test_requires_same_literals():
+    cache = SemanticCache(hashed_vector, threshold=0.5)
+    cache.set("Which breweries in Ohio sell IPA?", "OHIO", scope=None)
+
+    assert cache.get("Which breweries in Oregon sell IPA?") is None
+    assert cache.get("Which breweries in Ohio sell IPA?") == "OHIO"
+
+
+def test_evicts_least_recently_used():
+    cache = SemanticCache(hashed_vector, threshold=0.9, maxsize=2)
+    cache.set("first question", 1, scope="a")
+    cache.set("second question", 2, scope="b")
+    cache.set("third question", 3, scope="a")
+
+    assert len(cache) == 2
+    assert cache.get("first question", scope="a") is None
+    assert cache.get("second question", scope="b") == 2
+
+
+def test_miss_then_store_embeds_the_question_once():
+    embedded = []
+
+    def embed(text):
+        embedded.append(text)
+        return hashed_vector(text)
+
+    cache = SemanticCache(embed, threshold=0.9)
+    question = "How many orders in total?"
+    assert cache.get(question, scope="me") is None
+    cache.set(question, "SQL", scope="me")
+
+    assert cache.get(question, scope="me") == "SQL"
+    assert embedded == [question]
+
+
+def test_extract_literals():
+    assert extract_literals("Top 5 beers in 'New York' last Month") == {
+        "5",
+        "new york",
+        "month",
+    }
+    assert extract_literals("What did I buy?") == extract_literals("What did I buy")
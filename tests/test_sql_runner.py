@@ -0,0 +1,227 @@
+"""Tests for SQL validation, execution and caching in tools.sql_runner."""
+
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import FakeEmbeddings
+from tools.sql_runner import SQLRunner
+
+CUSTOMERS = [
+    (
+        "CLT-AAA111",
+        "10 Barrel Brewing Co",
+        "Bend",
+        "Oregon",
+        "97702",
+        ["large", "micro", "brewpub"],
+        ["Budweiser", "Corona Extra", "Stella Artois", "Brahma", "SKOL"],
+        ["Deschutes Brewery", "Brooklyn Brewery", "Stone Brewing"],
+    ),
+    (
+        "CLT-BBB222",
+        "Against the Grain Brewery",
+        "Louisville",
+        "Kentucky",
+        "40203",
+        ["brewpub", "micro", "regional"],
+        ["Jupiler", "Quilmes", "Victoria", "Aguila", "Cass Fresh"],
+        ["10 Barrel Brewing Co", "Stone Brewing", "Brooklyn Brewery"],
+    ),
+    (
+        "CLT-CCC333",
+        "Deschutes Brewery",
+        "Bend",
+        "Oregon",
+        "97702",
+        ["regional", "micro", "large"],
+        ["Budweiser", "SKOL", "Brahma", "Jupiler", "Victoria"],
+        ["10 Barrel Brewing Co", "Brooklyn Brewery", "Stone Brewing"],
+    ),
+]
+
+
+@pytest.fixture
+def customers_db(tmp_path) -> str:
+    """Create a small customers database with the production schema."""
+    path = tmp_path / "customers.db"
+    conn = sqlite3.connect(path)
+    conn.execute("""
+        CREATE TABLE customers (
+            client_id TEXT PRIMARY KEY,
+            client_name TEXT NOT NULL,
+            client_city TEXT NOT NULL,
+            client_state TEXT NOT NULL,
+            postal_code TEXT NOT NULL,
+            top3_brewery_types TEXT NOT NULL,
+            top5_beers_recently TEXT NOT NULL,
+            top3_breweries_recently TEXT NOT NULL
+        )
+        """)
+    conn.executemany(
+        "INSERT INTO customers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (*row[:5], json.dumps(row[5]), json.dumps(row[6]), json.dumps(row[7]))
+            for row in CUSTOMERS
+        ],
+    )
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+class ScriptedLLM:
+    """Streams a fixed SQL answer, the way the Gemini chat model does."""
+
+    def __init__(self):
+        self.sql = ""
+        self.calls = 0
+
+    def stream(self, prompt):
+        self.calls += 1
+        text = self.sql + ";\n\nThis query answers the question."
+        for start in range(0, len(text), 8):
+            yield SimpleNamespace(content=text[start : start + 8])
+
+
+@pytest.fixture
+def llm():
+    return ScriptedLLM()
+
+
+@pytest.fixture
+def runner(customers_db, llm):
+    runner = SQLRunner(database_path=customers_db)
+    runner.llm = llm
+    runner._context_cache_disabled = True
+    runner._embeddings = FakeEmbeddings()
+    yield runner
+    runner.close()
+
+
+@pytest.mark.parametrize(
+    "sql_query",
+    [
+        "SELECT * FROM customers",
+        "SELECT client_state, COUNT(*) FROM customers GROUP BY client_state",
+        "SELECT 'DROP TABLE customers' AS text",
+        "SELECT 1 -- ; DROP TABLE customers",
+        "WITH t AS (SELECT client_id FROM customers) SELECT * FROM t",
+    ],
+)
+def test_validate_read_only_accepts_queries(runner, sql_query):
+    is_valid, error = runner._validate_read_only(sql_query)
+    assert is_valid, error
+
+
+@pytest.mark.parametrize(
+    "sql_query",
+    [
+        "DROP TABLE customers",
+        "DELETE FROM customers",
+        "UPDATE customers SET client_name = 'x'",
+        "INSERT INTO customers (client_id) VALUES ('x')",
+        "SELECT 1; DROP TABLE customers",
+        "PRAGMA writable_schema = 1",
+    ],
+)
+def test_validate_read_only_rejects_modifications(runner, sql_query):
+    is_valid, _ = runner._validate_read_only(sql_query)
+    assert not is_valid
+
+
+def test_analytical_query_runs_the_validated_text(runner, llm):
+    # The commented-out filter must stay a comment: 3 clients, not 2
+    llm.sql = "SELECT COUNT(*) AS n FROM customers\n-- WHERE client_state = 'Oregon'\n"
+
+    result = runner.run_analytical_query("How many clients are there?", "CLT-AAA111")
+
+    assert result["privacy_compliant"]
+    assert result["sql_query"].startswith(llm.sql)
+    assert result["result"] == [{"n": 3}]
+
+
+def test_analytical_query_blocks_modifying_sql(runner, llm):
+    llm.sql = "DROP TABLE customers"
+
+    result = runner.run_analytical_query("Please drop everything", "CLT-AAA111")
+
+    assert result["query_type"] == "blocked"
+    assert not result["privacy_compliant"]
+    assert runner.get_client_profile(client_id="CLT-AAA111")["result"] is not None
+
+
+def test_analytical_query_blocks_other_clients_data(runner, llm):
+    llm.sql = "SELECT top5_beers_recently FROM customers WHERE client_id = 'CLT-BBB222'"
+
+    result = runner.run_analytical_query("What does that client buy?", "CLT-AAA111")
+
+    assert result["query_type"] == "blocked"
+    assert result["error"].startswith("PRIVACY_VIOLATION")
+
+
+def test_analytical_rows_are_copies(runner, llm):
+    llm.sql = "SELECT client_state, COUNT(*) AS n FROM customers GROUP BY client_state"
+    question = "How many clients per state?"
+
+    first = runner.run_analytical_query(question, "CLT-AAA111")
+    first["result"][0]["n"] = -1
+    second = runner.run_analytical_query(question, "CLT-AAA111")
+
+    assert llm.calls == 1
+    assert {row["n"] for row in second["result"]} == {1, 2}
+
+
+def test_semantic_cache_does_not_reuse_sql_across_literals(runner, llm):
+    llm.sql = "SELECT COUNT(*) AS n FROM customers WHERE client_state = 'Oregon'"
+    runner.run_analytical_query("How many clients are in Oregon?", "CLT-AAA111")
+
+    llm.sql = "SELECT COUNT(*) AS n FROM customers WHERE client_state = 'Ohio'"
+    result = runner.run_analytical_query("How many clients are in Ohio?", "CLT-AAA111")
+
+    assert llm.calls == 2
+    assert result["result"] == [{"n": 0}]
+
+
+def test_profile_lookup_by_client_id(runner):
+    profile = runner.get_client_profile(client_id="CLT-AAA111")
+
+    assert profile["search_method"] == "client_id"
+    assert profile["result"]["client_name"] == "10 Barrel Brewing Co"
+    assert profile["result"]["top3_brewery_types"] == ["large", "micro", "brewpub"]
+
+
+def test_profile_lookup_falls_back_to_postal_code_and_name(runner):
+    profile = runner.get_client_profile(
+        client_id="CLT-NOPE00", postal_code="40203", client_name="against"
+    )
+
+    assert profile["search_method"] == "postal_code_and_name"
+    assert profile["result"]["client_id"] == "CLT-BBB222"
+
+
+def test_profile_lookup_not_found(runner):
+    profile = runner.get_client_profile(client_id="CLT-NOPE00")
+
+    assert profile["search_method"] == "not_found"
+    assert profile["result"] is None
+
+
+def test_profile_fields_without_client_name(runner):
+    profile = runner.get_client_profile(client_id="CLT-AAA111", fields=["client_city"])
+
+    assert profile["result"] == {"client_city": "Bend"}
+
+
+def test_cached_profiles_are_copies(runner):
+    first = runner.get_client_profile(client_id="CLT-AAA111")
+    first["result"]["top5_beers_recently"].append("Mutated")
+    first["result"]["client_name"] = "Mutated"
+
+    second = runner.get_client_profile(client_id="CLT-AAA111")
+
+    assert second["source"] == "cache_hit"
+    assert second["result"]["client_name"] == "10 Barrel Brewing Co"
+    assert "Mutated" not in second["result"]["top5_beers_recently"]
@@ -0,0 +1,40 @@
+"""Tests for utils.ttl_cache."""
+
+from utils import ttl_cache
+from utils.ttl_cache import TTLCache
+
+
+def test_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("key", "value")
+
+    now[0] += 9
+    assert cache.get("key") == "value"
+    now[0] += 2
+    assert cache.get("key", "missing") == "missing"
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_stores_references():
+    # Callers that hand out cached values must copy them (see the tools)
+    cache = TTLCache()
+    value = {"rows": [1]}
+    cache.set("key", value)
+
+    assert cache.get("key") is value
+    assert cache.pop("key") is value
+    assert cache.get("key") is None
@@ -0,0 +1,201 @@
+"""Tests for the cache lifecycle of tools.web_explorer."""
+
+import asyncio
+import threading
+
+import pytest
+
+import tools.web_explorer as web_explorer
+import utils.rag_manager as rag_manager
+from conftest import FakeEmbeddings
+from tools.web_explorer import WebExplorer
+
+
+class FakeGenaiClient:
+    created = 0
+
+    def __init__(self, *args, **kwargs):
+        FakeGenaiClient.created += 1
+
+
+class Grounding:
+    """Stands in for Gemini Grounding; blocks while `gate` is cleared."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+        self.gate.set()
+        self.calls = 0
+        self.finished = 0
+
+    def __call__(self, brewery_name, address, url):
+        self.calls += 1
+        self.gate.wait(timeout=10)
+        self.finished += 1
+        return f"Fresh {brewery_name}"
+
+
+@pytest.fixture(autouse=True)
+def fake_gemini(monkeypatch):
+    monkeypatch.setattr(rag_manager, "GoogleGenerativeAIEmbeddings", FakeEmbeddings)
+    monkeypatch.setattr(web_explorer, "ChatGoogleGenerativeAI", lambda **kw: None)
+    monkeypatch.setattr(web_explorer.genai, "Client", FakeGenaiClient)
+    FakeGenaiClient.created = 0
+
+
+@pytest.fixture
+def grounding(monkeypatch):
+    grounding = Grounding()
+    monkeypatch.setattr(
+        WebExplorer,
+        "_grounded_search_summary",
+        lambda explorer, **query: grounding(**query),
+    )
+    return grounding
+
+
+@pytest.fixture
+def index_path(tmp_path):
+    return str(tmp_path / "faiss_index")
+
+
+@pytest.fixture
+def explorer(index_path, grounding):
+    explorer = WebExplorer(index_path=index_path)
+    yield explorer
+    explorer.close()
+
+
+def summary(explorer, name):
+    result, _ = explorer.rag_manager.search_cache(name, brewery_name=name)
+    return result["summary"]
+
+
+def test_batch_leaves_the_explorer_usable(explorer):
+    items = [
+        {"brewery_name": "Stone Brewing", "url": "https://stone.com"},
+        {"brewery_name": "Pizza Port", "url": "https://pizzaport.com"},
+    ]
+
+    first = asyncio.run(explorer.get_website_summaries_batch(items))
+    second = explorer.get_website_summary("Modern Times", "https://moderntimes.com")
+
+    assert [r["source"] for r in first] == ["web_search", "web_search"]
+    assert second["source"] == "web_search"
+
+
+def test_calls_do_not_write_the_index(explorer, monkeypatch):
+    saves = []
+    monkeypatch.setattr(
+        explorer.rag_manager, "save_index", lambda: saves.append(1) or True
+    )
+
+    explorer.get_website_summary("Stone Brewing", "https://stone.com")
+    asyncio.run(
+        explorer.get_website_summaries_batch(
+            [{"brewery_name": "Pizza Port", "url": "https://pizzaport.com"}]
+        )
+    )
+
+    assert saves == []
+
+
+def test_close_saves_pending_entries(index_path, grounding):
+    explorer = WebExplorer(index_path=index_path)
+    explorer.get_website_summary("Stone Brewing", "https://stone.com")
+    explorer.close()
+
+    reloaded = rag_manager.RAGManager(index_path=index_path)
+    try:
+        result, status = reloaded.search_cache("Stone", brewery_name="Stone Brewing")
+        assert status == "CACHE_HIT"
+        assert result["summary"] == "Fresh Stone Brewing"
+    finally:
+        reloaded.close()
+
+
+@pytest.fixture
+def shared_explorer(tmp_path, monkeypatch, grounding):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(web_explorer, "_DEFAULT_EXPLORER", None)
+    yield
+    if web_explorer._DEFAULT_EXPLORER is not None:
+        web_explorer._DEFAULT_EXPLORER.close()
+
+
+def test_module_functions_share_one_explorer(shared_explorer, grounding):
+    first = web_explorer.get_website_summary("Stone Brewing", "https://stone.com")
+    # The summary is stored in the background
+    web_explorer._get_explorer().rag_manager._wait_for_tasks()
+    second = web_explorer.get_website_summary("Stone Brewing", "https://stone.com")
+    web_explorer.get_website_summaries_batch(
+        [{"brewery_name": "Pizza Port", "url": "https://pizzaport.com"}]
+    )
+    web_explorer._get_explorer().rag_manager._wait_for_tasks()
+    third = web_explorer.get_website_summary("Pizza Port", "https://pizzaport.com")
+
+    assert (first["source"], second["source"]) == ("web_search", "cache_hit")
+    assert third["source"] == "cache_hit"
+    assert FakeGenaiClient.created == 1
+    assert grounding.calls == 2
+
+
+def make_stale(manager, name):
+    doc_id = manager.vectorstore.index_to_docstore_id[manager._candidate_ids(name)[0]]
+    metadata = manager.vectorstore.docstore.search(doc_id).metadata
+    metadata["creation_ts"] -= (manager.ttl_days + 1) * 86400
+
+
+def test_stale_hit_returns_before_the_refresh_finishes(explorer, grounding):
+    explorer.rag_manager.add_to_cache("Stone Brewing", "https://stone.com", "Old")
+    make_stale(explorer.rag_manager, "Stone Brewing")
+    grounding.gate.clear()
+
+    result = explorer.get_website_summary("Stone Brewing", "https://stone.com")
+
+    assert result["source"] == "cache_stale_served"
+    assert result["summary"] == "Old"
+    assert grounding.finished == 0
+    grounding.gate.set()
+    explorer.rag_manager.flush(force=True)
+    assert summary(explorer, "Stone Brewing") == "Fresh Stone Brewing"
+
+
+def test_shared_explorer_serves_stale_without_waiting(shared_explorer, grounding):
+    explorer = web_explorer._get_explorer()
+    explorer.rag_manager.add_to_cache("Stone Brewing", "https://stone.com", "Old")
+    make_stale(explorer.rag_manager, "Stone Brewing")
+    grounding.gate.clear()
+
+    try:
+        result = web_explorer.get_website_summary("Stone Brewing", "https://stone.com")
+        assert result["source"] == "cache_stale_served"
+        assert grounding.finished == 0
+    finally:
+        grounding.gate.set()
+
+
+class BlockingEmbeddings(FakeEmbeddings):
+    """Embeds documents (cache writes) only once `gate` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+
+    def embed_documents(self, texts, **kwargs):
+        self.gate.wait(timeout=10)
+        return super().embed_documents(texts, **kwargs)
+
+
+def test_miss_returns_before_the_summary_is_stored(shared_explorer):
+    explorer = web_explorer._get_explorer()
+    embeddings = BlockingEmbeddings()
+    explorer.rag_manager.embeddings = embeddings
+
+    try:
+        result = web_explorer.get_website_summary("Stone Brewing", "https://stone.com")
+        assert result["source"] == "web_search"
+        assert embeddings.calls == 0
+    finally:
+        embeddings.gate.set()
+    explorer.rag_manager.flush(force=True)
+    assert summary(explorer, "Stone Brewing") == "Fresh Stone Brewing"
@@ -6,38 +6,46 @@ filtering out breweries that the client has already purchased from (brewery_hist
 It ensures recommendations are always novel and relevant to the client's preferences.
 """
 
+import asyncio
+import copy
+import functools
+import itertools
 import logging
+import sys
+import threading
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urlencode
+
+import numpy as np
+import urllib3
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+from urllib3.util.retry import Retry
+
+# Run as a script (python tools/brewery_finder.py) the project root is not on
+# the path; add it so the demo below keeps working standalone.
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.ttl_cache import TTLCache  # noqa: E402
+
+# orjson decodes the API payload several times faster than the stdlib decoder;
+# fall back to the stdlib when it is not installed. Both accept raw bytes.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-import requests
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class BreweryFinder:
-    """
-    Brewery Finder Tool for discovering new brewery opportunities.
-
-    This tool integrates with OpenBreweryDB API to find breweries matching
-    the client's location and preferred brewery types, while filtering out
-    breweries from their purchase history.
-    """
-
-    # OpenBreweryDB API base URL (v1 API)
-    API_BASE_URL = "https://api.openbrewerydb.org/v1/breweries"
-
-    # Request timeout in seconds
-    REQUEST_TIMEOUT = 10
-
-    # Maximum number of results to fetch from API
-    MAX_RESULTS = 50
-
-    # State code to full name mapping (common US states)
-    STATE_MAP = {
+# State code to full name mapping (common US states)
+_STATE_MAP = MappingProxyType(
+    {
         "CA": "california",
         "NY": "new_york",
         "TX": "texas",
@@ -89,14 +97,166 @@ class BreweryFinder:
         "VT": "vermont",
         "WY": "wyoming",
     }
+)
+
+# Read-only lookup from uppercased state code or full name to the API value,
+# so any known spelling resolves with a single dict probe
+_STATE_NORMALIZED = MappingProxyType(
+    {
+        **_STATE_MAP,
+        **{name.upper(): name for name in _STATE_MAP.values()},
+        **{name.replace("_", " ").upper(): name for name in _STATE_MAP.values()},
+    }
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _build_url(base_url: str, query: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Build the full request URL for a normalized, sorted query tuple.
+
+    Cached so hot searches skip re-encoding the query string on every call.
+
+    Args:
+        base_url: API endpoint
+        query: Sorted (param, value) pairs, already normalized
+
+    Returns:
+        URL with the encoded query string appended
+    """
+    return f"{base_url}?{urlencode(query)}"
+
+
+class BreweryFinder:
+    """
+    Brewery Finder Tool for discovering new brewery opportunities.
+
+    This tool integrates with OpenBreweryDB API to find breweries matching
+    the client's location and preferred brewery types, while filtering out
+    breweries from their purchase history.
+    """
+
+    # OpenBreweryDB API base URL (v1 API)
+    API_BASE_URL = "https://api.openbrewerydb.org/v1/breweries"
+
+    # Request timeout in seconds
+    REQUEST_TIMEOUT = 10
+
+    # Maximum number of results to fetch from API
+    MAX_RESULTS = 50
+
+    # Maximum number of pages fetched when a result limit is requested
+    MAX_PAGES = 5
+
+    # Common brewery suffixes, longest/most specific first
+    _SUFFIXES = (
+        " brewing company",
+        " brewing co",
+        " brewpub",
+        " brewery",
+        " brewing",
+        " co",
+    )
+
+    # Fuzzy matching thresholds (0-100): history hits and best-name matches
+    HISTORY_MATCH_CUTOFF = 85
+    NAME_MATCH_CUTOFF = 70
+
+    # In-process cache for successful API responses (entries, seconds)
+    RESPONSE_CACHE_SIZE = 512
+    RESPONSE_CACHE_TTL = 300
+    RESULT_CACHE_SIZE = 128
+    RESULT_CACHE_TTL = 300
+    # How long ETag/Last-Modified validators are kept for conditional GETs
+    REVALIDATE_TTL = 86400
+
+    # Brewery types accepted by OpenBreweryDB's by_type filter
+    _VALID_TYPES = frozenset(
+        {
+            "micro",
+            "nano",
+            "regional",
+            "brewpub",
+            "large",
+            "planning",
+            "bar",
+            "contract",
+            "proprietor",
+            "closed",
+        }
+    )
+
+    # State code to full name mapping (common US states)
+    STATE_MAP = _STATE_MAP
+
+    # (output field, API field, default) triples used by _format_brewery_result
+    _FIELDS = (
+        # Core identification
+        ("brewery_id", "id", ""),
+        ("brewery_name", "name", ""),
+        ("brewery_type", "brewery_type", ""),
+        # Address information (structured)
+        ("address_1", "address_1", None),
+        ("address_2", "address_2", None),
+        ("address_3", "address_3", None),
+        ("street", "street", None),
+        # Location
+        ("city", "city", ""),
+        ("state", "state", ""),
+        ("state_province", "state_province", ""),
+        ("postal_code", "postal_code", ""),
+        ("country", "country", ""),
+        # Coordinates
+        ("latitude", "latitude", None),
+        ("longitude", "longitude", None),
+        # Contact information
+        ("phone", "phone", None),
+        ("website_url", "website_url", None),
+    )
 
     def __init__(self):
         """Initialize the Brewery Finder tool."""
+        # Persistent connection pool: keeps connections to the API alive so
+        # repeated calls skip the TCP + TLS handshake. maxsize leaves headroom for
+        # several concurrent search_many batches.
+        self._http = urllib3.PoolManager(
+            num_pools=4,
+            maxsize=32,
+            headers={"Accept-Encoding": "gzip", "Connection": "keep-alive"},
+            retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[429, 500, 502, 503, 504],
+                # Hand the last response back so its status code is reported
+                raise_on_status=False,
+            ),
+            timeout=urllib3.Timeout(connect=3.0, read=self.REQUEST_TIMEOUT),
+        )
+
+        # Successful API responses keyed by the normalized query parameters
+        self._response_cache = TTLCache(
+            maxsize=self.RESPONSE_CACHE_SIZE, ttl=self.RESPONSE_CACHE_TTL
+        )
+        # Validators (+ body) of expired responses, so they can be revalidated with
+        # a conditional GET instead of re-downloading the full JSON
+        self._validators = TTLCache(
+            maxsize=self.RESPONSE_CACHE_SIZE, ttl=self.REVALIDATE_TTL
+        )
+        # Final search_breweries results, keyed on the normalized query + history
+        self._result_cache = TTLCache(
+            maxsize=self.RESULT_CACHE_SIZE, ttl=self.RESULT_CACHE_TTL
+        )
         logger.info("Brewery Finder Tool initialized")
 
-    def _normalize_brewery_name(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _normalize_brewery_name(name: str) -> str:
         """
-        Normalize brewery name for comparison (lowercase, strip whitespace).
+        Normalize brewery name for comparison (strip whitespace, casefold).
+
+        casefold() is a stricter lowercase for caseless matching (e.g. 'ß' == 'ss'),
+        so history entries and API names compare equal regardless of casing.
+        Memoized process-wide, since the same history repeats across calls.
 
         Args:
             name: Brewery name to normalize
@@ -104,9 +264,11 @@ class BreweryFinder:
         Returns:
             Normalized brewery name
         """
-        return name.lower().strip()
+        return name.strip().casefold()
 
-    def _simplify_brewery_name(self, name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _simplify_brewery_name(name: str) -> str:
         """
         Simplify brewery name by removing common suffixes for better matching.
         Used for API searches to improve match rate.
@@ -119,38 +281,51 @@ class BreweryFinder:
         """
         simplified = name.lower().strip()
 
-        # Remove common brewery suffixes (in order of specificity)
-        suffixes = [
-            " brewing company",
-            " brewing co",
-            " brewery",
-            " brewing",
-            " brewpub",
-            " co",
-        ]
-
-        for suffix in suffixes:
+        # Only the trailing suffix is cut; the first (most specific) match wins
+        for suffix in BreweryFinder._SUFFIXES:
             if simplified.endswith(suffix):
-                simplified = simplified.replace(suffix, "").strip()
-                break
+                return simplified[: -len(suffix)].rstrip()
 
         return simplified
 
-    def _is_brewery_new(self, brewery_name: str, brewery_history: List[str]) -> bool:
+    def clear_cache(self) -> None:
+        """Drop all cached API responses and search results."""
+        self._response_cache.clear()
+        self._validators.clear()
+        self._result_cache.clear()
+        logger.info("Brewery Finder caches cleared")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _norm_token(value: str) -> str:
         """
-        Check if a brewery is new (not in client's purchase history).
+        Normalize a query value to the API's lowercase, underscored form.
+
+        Memoized, since cities and types repeat heavily across a session.
 
         Args:
-            brewery_name: Name of the brewery to check
-            brewery_history: List of brewery names from client's history
+            value: Raw query value (e.g., 'San Diego')
 
         Returns:
-            True if brewery is new, False if already in history
+            Normalized token (e.g., 'san_diego')
         """
-        normalized_name = self._normalize_brewery_name(brewery_name)
-        normalized_history = [self._normalize_brewery_name(h) for h in brewery_history]
+        return value.lower().strip().replace(" ", "_")
 
-        return normalized_name not in normalized_history
+    def _normalize_state(self, state: str) -> str:
+        """
+        Convert a state code or name to the API's by_state form.
+
+        Args:
+            state: State code or name (e.g., 'CA', 'california', 'New York')
+
+        Returns:
+            Lowercase full state name with underscores (e.g., 'california')
+        """
+        state = state.strip()
+        # Fast path for the common case of a two-letter state code
+        if len(state) == 2 and state.isalpha():
+            return _STATE_MAP.get(state.upper(), state.lower())
+        return _STATE_NORMALIZED.get(state.upper()) or self._norm_token(state)
 
     def _call_api(
         self,
@@ -158,6 +333,8 @@ class BreweryFinder:
         state: Optional[str] = None,
         brewery_type: Optional[str] = None,
         brewery_name: Optional[str] = None,
+        page: int = 1,
+        per_page: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Make API call to OpenBreweryDB.
@@ -167,13 +344,17 @@ class BreweryFinder:
             state: Optional state/province code (e.g., 'CA', 'california')
             brewery_type: Optional brewery type filter
             brewery_name: Optional specific brewery name to search for
+            page: Page number to fetch (1-based)
+            per_page: Results per page (default: MAX_RESULTS)
 
         Returns:
             Dictionary with 'status' and 'data' or 'error'
         """
         try:
             # Build query parameters
-            params = {"per_page": self.MAX_RESULTS}
+            params = {"per_page": per_page or self.MAX_RESULTS}
+            if page > 1:
+                params["page"] = page
 
             # If searching by specific name, use by_name
             # Note: OpenBreweryDB API does substring search, so use main keywords only
@@ -181,89 +362,297 @@ class BreweryFinder:
                 # Simplify name (remove common suffixes) for better API matching
                 search_name = self._simplify_brewery_name(brewery_name)
                 # Replace spaces with underscores for API
-                params["by_name"] = search_name.replace(" ", "_")
+                params["by_name"] = self._norm_token(search_name)
 
             if city:
-                params["by_city"] = city.lower().replace(" ", "_")
+                params["by_city"] = self._norm_token(city)
 
             if state:
-                # Convert state code to full name if needed (e.g., CA -> california)
-                state_upper = state.upper()
-                if state_upper in self.STATE_MAP:
-                    params["by_state"] = self.STATE_MAP[state_upper]
-                else:
-                    params["by_state"] = state.lower().replace(" ", "_")
+                params["by_state"] = self._normalize_state(state)
 
             if brewery_type:
-                params["by_type"] = brewery_type.lower()
-
-            logger.info(f"Calling OpenBreweryDB API: {params}")
-
-            # Make API request
-            response = requests.get(
-                self.API_BASE_URL, params=params, timeout=self.REQUEST_TIMEOUT
+                params["by_type"] = self._norm_token(brewery_type)
+
+            # Params are already normalized, so equivalent spellings share an entry
+            cache_key = tuple(sorted(params.items()))
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("API cache hit: %d breweries for %s", len(cached), params)
+                return {"status": "success", "data": cached}
+
+            logger.info("Calling OpenBreweryDB API: %s", params)
+
+            # Make API request (conditional when an earlier response can be reused).
+            # Passing headers replaces the pool defaults, so merge them in.
+            stale = self._validators.get(cache_key)
+            headers = {**self._http.headers, **stale[0]} if stale else None
+            response = self._http.request(
+                "GET", _build_url(self.API_BASE_URL, cache_key), headers=headers
             )
 
             # Check response status
-            if response.status_code == 200:
-                data = response.json()
+            if response.status == 304 and stale:
+                logger.info("API response not modified: %d breweries", len(stale[1]))
+                self._response_cache.set(cache_key, stale[1])
+                return {"status": "success", "data": stale[1]}
+            elif response.status == 200:
+                data = _json_loads(response.data)
                 # API may return dict with message instead of list
                 if isinstance(data, dict) and "message" in data:
                     # API returned a message (e.g., no results or API info)
-                    logger.info(f"API returned message: {data['message']}")
+                    logger.info("API returned message: %s", data["message"])
+                    self._store_response(cache_key, response, [])
                     return {"status": "success", "data": []}
                 elif isinstance(data, list):
-                    logger.info(f"API call successful: {len(data)} breweries found")
+                    logger.info("API call successful: %d breweries found", len(data))
+                    self._store_response(cache_key, response, data)
                     return {"status": "success", "data": data}
                 else:
                     error_msg = f"Unexpected API response format: {type(data)}"
-                    logger.error(f"{error_msg}")
+                    logger.error(error_msg)
                     return {"status": "API_ERROR", "error": error_msg}
             else:
-                error_msg = f"API returned status code {response.status_code}"
-                logger.error(f"{error_msg}")
+                error_msg = f"API returned status code {response.status}"
+                logger.error(error_msg)
                 return {"status": "API_ERROR", "error": error_msg}
 
-        except requests.exceptions.Timeout:
-            error_msg = f"API request timeout after {self.REQUEST_TIMEOUT}s"
-            logger.error(f"{error_msg}")
-            return {"status": "API_ERROR", "error": error_msg}
-
-        except requests.exceptions.RequestException as e:
-            error_msg = f"API request failed: {str(e)}"
-            logger.error(f"{error_msg}")
+        except urllib3.exceptions.HTTPError as e:
+            # Exhausted retries wrap the last failure in MaxRetryError.
+            # NewConnectionError subclasses ConnectTimeoutError for legacy reasons.
+            reason = getattr(e, "reason", None) or e
+            if isinstance(reason, urllib3.exceptions.TimeoutError) and not isinstance(
+                reason, urllib3.exceptions.NewConnectionError
+            ):
+                error_msg = f"API request timeout after {self.REQUEST_TIMEOUT}s"
+            else:
+                error_msg = f"API request failed: {str(e)}"
+            logger.error(error_msg)
             return {"status": "API_ERROR", "error": error_msg}
 
         except Exception as e:
             error_msg = f"Unexpected error: {str(e)}"
-            logger.error(f"{error_msg}")
+            logger.error(error_msg)
             return {"status": "API_ERROR", "error": error_msg}
 
+    def _store_response(
+        self,
+        cache_key: tuple,
+        response: urllib3.BaseHTTPResponse,
+        data: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Cache a successful API response and remember its validators, if any.
+
+        Args:
+            cache_key: Normalized query parameters
+            response: HTTP response the data was decoded from
+            data: Breweries returned by the API
+        """
+        self._response_cache.set(cache_key, data)
+
+        conditional = {}
+        etag = response.headers.get("ETag")
+        if etag:
+            conditional["If-None-Match"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified:
+            conditional["If-Modified-Since"] = last_modified
+        if conditional:
+            self._validators.set(cache_key, (conditional, data))
+
+    def _fetch_breweries(
+        self,
+        city: Optional[str],
+        state: Optional[str],
+        brewery_type: Optional[str],
+        brewery_name: Optional[str],
+        history_set: FrozenSet[str],
+        filter_history: bool,
+        limit: Optional[int],
+    ) -> Dict[str, Any]:
+        """
+        Fetch breweries from the API, paging until enough new ones are collected.
+
+        Without a limit a single page of MAX_RESULTS is fetched. With a limit,
+        pages of min(limit * 2, MAX_RESULTS) are requested and fetching stops once
+        `limit` breweries survive the history filter, the API runs out of results,
+        or MAX_PAGES is reached.
+
+        Args:
+            city: City name to search
+            state: Optional state/province code
+            brewery_type: Optional brewery type filter
+            brewery_name: Optional specific brewery name to search for
+            history_set: Normalized history names (see _build_history_set)
+            filter_history: Whether history filtering applies
+            limit: Optional number of new breweries wanted
+
+        Returns:
+            Dictionary with 'status' and 'data' (all fetched breweries) or 'error'.
+            When history filtering applies, 'new_mask' holds the
+            _new_brewery_mask of 'data' so callers do not score it again.
+        """
+        check_history = filter_history and bool(history_set)
+
+        if not limit:
+            api_result = self._call_api(city, state, brewery_type, brewery_name)
+            if api_result["status"] == "success" and check_history:
+                api_result["new_mask"] = self._new_brewery_mask(
+                    api_result["data"], history_set
+                )
+            return api_result
+
+        per_page = min(limit * 2, self.MAX_RESULTS)
+        breweries: List[Dict[str, Any]] = []
+        page_masks: List[np.ndarray] = []
+        new_count = 0
+
+        for page in range(1, self.MAX_PAGES + 1):
+            api_result = self._call_api(
+                city, state, brewery_type, brewery_name, page=page, per_page=per_page
+            )
+            if api_result["status"] != "success":
+                if page == 1:
+                    return api_result
+                # Keep what earlier pages returned
+                break
+
+            page_data = api_result["data"]
+            breweries.extend(page_data)
+
+            if check_history:
+                page_mask = self._new_brewery_mask(page_data, history_set)
+                page_masks.append(page_mask)
+                new_count += int(page_mask.sum())
+            else:
+                new_count += len(page_data)
+
+            if new_count >= limit or len(page_data) < per_page:
+                break
+
+        result: Dict[str, Any] = {"status": "success", "data": breweries}
+        if check_history:
+            result["new_mask"] = (
+                np.concatenate(page_masks) if page_masks else np.zeros(0, dtype=bool)
+            )
+        return result
+
+    def _build_history_set(self, brewery_history: List[str]) -> FrozenSet[str]:
+        """
+        Normalize history once so each membership check is an O(1) set lookup.
+
+        Args:
+            brewery_history: List of brewery names from client's history
+
+        Returns:
+            Frozenset of normalized history names
+        """
+        return frozenset(self._normalize_brewery_name(h) for h in brewery_history)
+
+    def _match_key(self, name: str) -> str:
+        """Reduce a normalized name to what history matching compares."""
+        return self._simplify_brewery_name(default_process(name))
+
+    def _new_brewery_mask(
+        self, breweries: List[Dict[str, Any]], history_set: FrozenSet[str]
+    ) -> np.ndarray:
+        """
+        Flag which breweries are new (named and not matching any history entry).
+
+        All names are scored against all history entries in a single
+        rapidfuzz.process.cdist call. Names are compared without punctuation
+        or a trailing suffix such as 'Brewing Co', so 'Stone Brewing Co.'
+        still counts as 'Stone Brewing' already purchased. The token sort
+        ratio ignores word order but, unlike the token set ratio, does not
+        treat a name contained in another as a match ('Port' is not
+        'Pizza Port').
+
+        Args:
+            breweries: List of brewery dictionaries from API
+            history_set: Normalized history names (see _build_history_set)
+
+        Returns:
+            Boolean array, True where the brewery is new
+        """
+        names = [
+            self._normalize_brewery_name(brewery.get("name") or "")
+            for brewery in breweries
+        ]
+        named = np.fromiter(
+            (bool(name) for name in names), dtype=bool, count=len(names)
+        )
+        if not history_set or not names:
+            return named
+
+        scores = process.cdist(
+            [self._match_key(name) for name in names],
+            [self._match_key(name) for name in history_set],
+            scorer=fuzz.token_sort_ratio,
+            dtype=np.uint8,
+            workers=-1,
+        )
+        return named & (scores.max(axis=1) < self.HISTORY_MATCH_CUTOFF)
+
     def _filter_new_breweries(
-        self, breweries: List[Dict[str, Any]], brewery_history: List[str]
+        self, breweries: List[Dict[str, Any]], new_mask: np.ndarray
     ) -> List[Dict[str, Any]]:
         """
         Filter breweries to only include new ones (not in history).
 
         Args:
             breweries: List of brewery dictionaries from API
-            brewery_history: List of brewery names from client's history
+            new_mask: _new_brewery_mask of breweries, computed once per search
 
         Returns:
             Filtered list of new breweries
         """
-        new_breweries = []
-
-        for brewery in breweries:
-            brewery_name = brewery.get("name", "")
-            if brewery_name and self._is_brewery_new(brewery_name, brewery_history):
-                new_breweries.append(brewery)
+        new_breweries = [brewery for brewery, new in zip(breweries, new_mask) if new]
 
         logger.info(
-            f"Filtered to {len(new_breweries)} new breweries (from {len(breweries)} total)"
+            "Filtered to %d new breweries (from %d total)",
+            len(new_breweries),
+            len(breweries),
         )
         return new_breweries
 
+    def _best_name_matches(
+        self,
+        brewery_name: str,
+        breweries: List[Dict[str, Any]],
+        limit: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Rank breweries by fuzzy similarity to a searched name.
+
+        Args:
+            brewery_name: Brewery name the user asked for
+            breweries: List of brewery dictionaries from API
+            limit: Maximum number of matches to return (default: all)
+
+        Returns:
+            Indices into breweries scoring at least NAME_MATCH_CUTOFF, best
+            score first
+        """
+        simplified_search = self._simplify_brewery_name(brewery_name)
+        # Simplify each API name once; unnamed breweries are never candidates.
+        # WRatio already scores substring containment highly, so no separate
+        # containment pass is needed.
+        simplified_names = {
+            index: simplified
+            for index, simplified in enumerate(
+                self._simplify_brewery_name(b.get("name") or "") for b in breweries
+            )
+            if simplified
+        }
+        matches = process.extract(
+            simplified_search,
+            simplified_names,
+            scorer=fuzz.WRatio,
+            limit=limit,
+            score_cutoff=self.NAME_MATCH_CUTOFF,
+        )
+        return [index for _, _, index in matches]
+
     def _format_brewery_result(self, brewery: Dict[str, Any]) -> Dict[str, Any]:
         """
         Format brewery data into a clean, structured result with ALL available fields.
@@ -274,28 +663,96 @@ class BreweryFinder:
         Returns:
             Formatted brewery dictionary with all API fields
         """
+        return {out: brewery.get(src, default) for out, src, default in self._FIELDS}
+
+    def _log_search_start(
+        self,
+        city: Optional[str],
+        state: Optional[str],
+        brewery_type: Optional[str],
+        brewery_name: Optional[str],
+        filter_history: bool,
+        brewery_history: List[str],
+    ) -> None:
+        """Log the search banner (DEBUG only, skipped entirely otherwise)."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        separator = "=" * 60
+        logger.debug("\n%s", separator)
+        logger.debug("BREWERY FINDER - Starting search")
+        logger.debug("   Brewery Name: %s", brewery_name or "Not specified")
+        logger.debug("   City: %s", city or "Not specified")
+        logger.debug("   State: %s", state or "Not specified")
+        logger.debug("   Type: %s", brewery_type or "Any")
+        logger.debug("   Filter History: %s", filter_history)
+        if filter_history:
+            logger.debug("   History: %d breweries to exclude", len(brewery_history))
+        else:
+            logger.debug("   History: Not filtering")
+        logger.debug("%s\n", separator)
+
+    def _log_search_complete(
+        self,
+        total_found: int,
+        returned: int,
+        filter_history: bool,
+        execution_time: float,
+    ) -> None:
+        """Log a one-line search summary."""
+        logger.info(
+            "BREWERY FINDER - Search completed: found=%d returned=%d filtered=%s "
+            "time=%.2fs",
+            total_found,
+            returned,
+            filter_history,
+            execution_time,
+        )
+
+    def _build_metadata(
+        self, start_time: float, search_params: Dict[str, Any], **counts: int
+    ) -> Dict[str, Any]:
+        """
+        Build the metadata block shared by every search_breweries response.
+
+        Each search returns through exactly one path, so this runs once per call
+        and the timestamp is taken a single time.
+
+        Args:
+            start_time: time.perf_counter() value taken when the search started
+            search_params: Search parameters echoed back to the caller
+            **counts: Result counters for this outcome (total_found, etc.)
+
+        Returns:
+            Metadata dictionary
+        """
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "execution_time": round(time.perf_counter() - start_time, 2),
+            **counts,
+            "search_params": search_params,
+        }
+
+    def _no_new_breweries_result(
+        self, start_time: float, search_params: Dict[str, Any], total_found: int
+    ) -> Dict[str, Any]:
+        """
+        Build the NO_NEW_BREWERIES response.
+
+        Args:
+            start_time: time.perf_counter() value taken when the search started
+            search_params: Search parameters echoed back to the caller
+            total_found: Number of breweries found before history filtering
+
+        Returns:
+            NO_NEW_BREWERIES response dictionary
+        """
         return {
-            # Core identification
-            "brewery_id": brewery.get("id", ""),
-            "brewery_name": brewery.get("name", ""),
-            "brewery_type": brewery.get("brewery_type", ""),
-            # Address information (structured)
-            "address_1": brewery.get("address_1", None),
-            "address_2": brewery.get("address_2", None),
-            "address_3": brewery.get("address_3", None),
-            "street": brewery.get("street", None),
-            # Location
-            "city": brewery.get("city", ""),
-            "state": brewery.get("state", ""),
-            "state_province": brewery.get("state_province", ""),
-            "postal_code": brewery.get("postal_code", ""),
-            "country": brewery.get("country", ""),
-            # Coordinates
-            "latitude": brewery.get("latitude", None),
-            "longitude": brewery.get("longitude", None),
-            # Contact information
-            "phone": brewery.get("phone", None),
-            "website_url": brewery.get("website_url", None),
+            "status": "NO_NEW_BREWERIES",
+            "message": "All breweries found are already in purchase history",
+            "metadata": self._build_metadata(
+                start_time, search_params, total_found=total_found, new_breweries=0
+            ),
         }
 
     def search_breweries(
@@ -306,12 +763,19 @@ class BreweryFinder:
         brewery_history: Optional[List[str]] = None,
         brewery_name: Optional[str] = None,
         filter_history: bool = True,
+        limit: Optional[int] = None,
+        output: str = "dict",
     ) -> Dict[str, Any]:
         """
         Search for breweries based on location, type, or specific name.
 
         This is the main entry point for the Brewery Finder tool.
 
+        When a limit is given, results are fetched page by page (per_page sized to
+        the limit) and fetching stops as soon as enough new breweries are collected.
+        Results are cached for RESULT_CACHE_TTL seconds per normalized query and
+        history, so repeated identical calls skip the whole pipeline.
+
         Args:
             city: City name to search (optional if brewery_name provided)
             state: Optional state/province code (e.g., 'CA', 'OR')
@@ -319,11 +783,14 @@ class BreweryFinder:
             brewery_history: List of brewery names the client has purchased from
             brewery_name: Optional specific brewery name to search for
             filter_history: Whether to filter out breweries from history (default: True)
+            limit: Optional maximum number of breweries to return
+            output: 'dict' (default) for a list of dictionaries, or 'arrow' for a
+                pyarrow.Table with one column per result field (requires pyarrow)
 
         Returns:
             Dictionary with search results:
             - status: 'success', 'NO_BREWERIES', 'NO_NEW_BREWERIES', or 'API_ERROR'
-            - data: List of brewery dictionaries (if success)
+            - data: List of brewery dictionaries, or a pyarrow.Table (if success)
             - error: Error message (if error)
             - metadata: Search metadata (timestamp, filters, counts)
 
@@ -338,155 +805,417 @@ class BreweryFinder:
             >>> if result['status'] == 'success':
             ...     print(f"Found {len(result['data'])} new breweries!")
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+
+        if output not in ("dict", "arrow"):
+            raise ValueError(f"output must be 'dict' or 'arrow', got {output!r}")
 
         if brewery_history is None:
             brewery_history = []
 
-        logger.info(f"\n{'='*60}")
-        logger.info(f"BREWERY FINDER - Starting search")
-        logger.info(f"   Brewery Name: {brewery_name or 'Not specified'}")
-        logger.info(f"   City: {city or 'Not specified'}")
-        logger.info(f"   State: {state or 'Not specified'}")
-        logger.info(f"   Type: {brewery_type or 'Any'}")
-        logger.info(f"   Filter History: {filter_history}")
-        logger.info(
-            f"   History: {len(brewery_history)} breweries to exclude"
-            if filter_history
-            else "   History: Not filtering"
+        search_params = {
+            "city": city,
+            "state": state,
+            "brewery_type": brewery_type,
+            "brewery_name": brewery_name,
+            "history_size": len(brewery_history),
+        }
+
+        self._log_search_start(
+            city, state, brewery_type, brewery_name, filter_history, brewery_history
         )
-        logger.info(f"{'='*60}\n")
 
-        # Step 1: Call OpenBreweryDB API
-        api_result = self._call_api(city, state, brewery_type, brewery_name)
+        # Step 0: The API answers an unknown type with an empty list, so skip the
+        # round trip and tell the caller which types are valid
+        if brewery_type and self._norm_token(brewery_type) not in self._VALID_TYPES:
+            logger.warning("NO_BREWERIES: Invalid brewery type '%s'", brewery_type)
+            return {
+                "status": "NO_BREWERIES",
+                "message": (
+                    f"Invalid brewery type '{brewery_type}'. Valid types: "
+                    f"{', '.join(sorted(self._VALID_TYPES))}"
+                ),
+                "metadata": self._build_metadata(
+                    start_time, search_params, total_found=0
+                ),
+            }
+
+        # Normalize history once; every later step reuses this set
+        history_set = (
+            self._build_history_set(brewery_history) if filter_history else frozenset()
+        )
+
+        # Step 0.5: Identical queries within RESULT_CACHE_TTL skip the whole pipeline
+        cache_key = self._result_cache_key(
+            city,
+            state,
+            brewery_type,
+            brewery_name,
+            history_set,
+            filter_history,
+            limit,
+        )
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Result cache hit: %s", cached["status"])
+            result = self._refresh_cached_result(cached, start_time, search_params)
+            return self._render(result, output)
+
+        result = self._run_search(
+            start_time,
+            search_params,
+            city,
+            state,
+            brewery_type,
+            brewery_name,
+            history_set,
+            filter_history,
+            limit,
+        )
+        # Errors are transient, so only cache answers the API actually gave.
+        # A copy is cached: the caller is free to mutate the result it receives
+        if result["status"] != "API_ERROR":
+            self._result_cache.set(cache_key, copy.deepcopy(result))
+        return self._render(result, output)
+
+    def _render(self, result: Dict[str, Any], output: str) -> Dict[str, Any]:
+        """
+        Turn the raw API records in a search result into the requested output.
+
+        For 'dict' each record is formatted into a new dictionary. For 'arrow'
+        the columns of a pyarrow.Table are filled straight from the raw
+        records, without building a dictionary per brewery. pyarrow is
+        imported lazily, so it is only required for output="arrow".
+
+        Args:
+            result: Search result whose 'data' (if present) holds raw API records
+            output: 'dict' or 'arrow' (see search_breweries)
+
+        Returns:
+            Result dictionary with the formatted 'data'
+        """
+        if "data" not in result:
+            return result
+
+        breweries = result["data"]
+        if output != "arrow":
+            data = [self._format_brewery_result(b) for b in breweries]
+        else:
+            import pyarrow as pa
+
+            data = pa.Table.from_pydict(
+                {
+                    out: [b.get(src, default) for b in breweries]
+                    for out, src, default in self._FIELDS
+                }
+            )
+        return {**result, "data": data}
+
+    def _result_cache_key(
+        self,
+        city: Optional[str],
+        state: Optional[str],
+        brewery_type: Optional[str],
+        brewery_name: Optional[str],
+        history_set: FrozenSet[str],
+        filter_history: bool,
+        limit: Optional[int],
+    ) -> tuple:
+        """
+        Build the result cache key from the normalized query and history.
+
+        Args:
+            city: City name to search
+            state: Optional state/province code
+            brewery_type: Optional brewery type filter
+            brewery_name: Optional specific brewery name to search for
+            history_set: Normalized history names (see _build_history_set)
+            filter_history: Whether history filtering applies
+            limit: Optional maximum number of breweries to return
+
+        Returns:
+            Hashable cache key
+        """
+        return (
+            self._norm_token(city) if city else None,
+            self._normalize_state(state) if state else None,
+            self._norm_token(brewery_type) if brewery_type else None,
+            self._simplify_brewery_name(brewery_name) if brewery_name else None,
+            history_set if filter_history else None,
+            limit or None,
+        )
+
+    def _refresh_cached_result(
+        self,
+        cached: Dict[str, Any],
+        start_time: float,
+        search_params: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Copy a cached result, refreshing its per-call metadata.
+
+        Args:
+            cached: Result previously returned by _run_search
+            start_time: time.perf_counter() value taken when the search started
+            search_params: Search parameters of the current call
+
+        Returns:
+            Result dictionary with new metadata; its raw records are still the
+            cached ones, so it must go through _render before reaching a caller
+        """
+        counts = {
+            key: value
+            for key, value in cached["metadata"].items()
+            if key not in ("timestamp", "execution_time", "search_params")
+        }
+        result = dict(cached)
+        result["metadata"] = self._build_metadata(start_time, search_params, **counts)
+        return result
+
+    def _run_search(
+        self,
+        start_time: float,
+        search_params: Dict[str, Any],
+        city: Optional[str],
+        state: Optional[str],
+        brewery_type: Optional[str],
+        brewery_name: Optional[str],
+        history_set: FrozenSet[str],
+        filter_history: bool,
+        limit: Optional[int],
+    ) -> Dict[str, Any]:
+        """
+        Fetch and filter breweries (the uncached search pipeline).
+
+        Args:
+            start_time: time.perf_counter() value taken when the search started
+            search_params: Search parameters echoed back to the caller
+            city: City name to search
+            state: Optional state/province code
+            brewery_type: Optional brewery type filter
+            brewery_name: Optional specific brewery name to search for
+            history_set: Normalized history names (see _build_history_set)
+            filter_history: Whether history filtering applies
+            limit: Optional maximum number of breweries to return
+
+        Returns:
+            Search result dictionary (see search_breweries), except that 'data'
+            holds the raw API records; _render formats them
+        """
+        # Step 1: Call OpenBreweryDB API (paginated when a limit is requested)
+        api_result = self._fetch_breweries(
+            city,
+            state,
+            brewery_type,
+            brewery_name,
+            history_set,
+            filter_history,
+            limit,
+        )
 
         if api_result["status"] != "success":
-            execution_time = time.time() - start_time
             return {
                 "status": "API_ERROR",
                 "error": api_result.get("error", "Unknown API error"),
-                "metadata": {
-                    "timestamp": datetime.now().isoformat(),
-                    "execution_time": round(execution_time, 2),
-                    "search_params": {
-                        "city": city,
-                        "state": state,
-                        "brewery_type": brewery_type,
-                    },
-                },
+                "metadata": self._build_metadata(start_time, search_params),
             }
 
         breweries = api_result["data"]
+        # Scored against history once; every later step reuses (and slices) it
+        new_mask = api_result.get("new_mask")
 
         # Step 2: Check if any breweries were found
         if not breweries:
-            execution_time = time.time() - start_time
             search_location = (
                 brewery_name if brewery_name else (city or "specified location")
             )
-            logger.warning(f"NO_BREWERIES: No breweries found for {search_location}")
+            logger.warning("NO_BREWERIES: No breweries found for %s", search_location)
             return {
                 "status": "NO_BREWERIES",
                 "message": f"No breweries found for '{search_location}'",
-                "metadata": {
-                    "timestamp": datetime.now().isoformat(),
-                    "execution_time": round(execution_time, 2),
-                    "total_found": 0,
-                    "search_params": {
-                        "city": city,
-                        "state": state,
-                        "brewery_type": brewery_type,
-                        "brewery_name": brewery_name,
-                    },
-                },
+                "metadata": self._build_metadata(
+                    start_time, search_params, total_found=0
+                ),
             }
 
-        # Step 2.5: If searching by specific name, try to find best match
+        # Step 2.1: Name-only pre-check. OpenBreweryDB has no field projection, so
+        # when history already covers every fetched name, stop before any
+        # matching or formatting work.
+        if new_mask is not None and not new_mask.any():
+            logger.warning(
+                "NO_NEW_BREWERIES: All %d breweries already in history", len(breweries)
+            )
+            return self._no_new_breweries_result(
+                start_time, search_params, len(breweries)
+            )
+
+        # Step 2.5: If searching by specific name, keep the closest fuzzy matches
         if brewery_name:
-            # Simplify the search term for comparison
-            simplified_search = self._simplify_brewery_name(brewery_name)
-            best_matches = []
-
-            for brewery in breweries:
-                brewery_name_from_api = brewery.get("name", "")
-                simplified_api_name = self._simplify_brewery_name(brewery_name_from_api)
-
-                # Check if simplified names match or if search term is in the brewery name
-                if (
-                    simplified_search in simplified_api_name
-                    or simplified_api_name in simplified_search
-                    or simplified_search == simplified_api_name
-                ):
-                    best_matches.append(brewery)
-
-            # If we found good matches, use only those
-            if best_matches:
-                breweries = best_matches
+            match_indices = self._best_name_matches(brewery_name, breweries)
+
+            # If we found good matches, use only those (best score first)
+            if match_indices:
+                breweries = [breweries[index] for index in match_indices]
+                if new_mask is not None:
+                    new_mask = new_mask[match_indices]
                 logger.info(
-                    f"Filtered to {len(best_matches)} best matches for '{brewery_name}'"
+                    "Filtered to %d best matches for '%s'", len(breweries), brewery_name
                 )
 
-        # Step 3: Filter out breweries from client's history (ONLY if filter_history is True)
-        if filter_history:
-            new_breweries = self._filter_new_breweries(breweries, brewery_history)
+        # Step 3: Filter out breweries from client's history (ONLY if filter_history is
+        # True and there is history to filter against)
+        if new_mask is not None:
+            new_breweries = self._filter_new_breweries(breweries, new_mask)
 
             # Step 4: Check if any new breweries remain after filtering
             if not new_breweries:
-                execution_time = time.time() - start_time
                 logger.warning(
-                    f"NO_NEW_BREWERIES: All {len(breweries)} breweries already in history"
+                    "NO_NEW_BREWERIES: All %d breweries already in history",
+                    len(breweries),
+                )
+                return self._no_new_breweries_result(
+                    start_time, search_params, len(breweries)
                 )
-                return {
-                    "status": "NO_NEW_BREWERIES",
-                    "message": f"All breweries found are already in purchase history",
-                    "metadata": {
-                        "timestamp": datetime.now().isoformat(),
-                        "execution_time": round(execution_time, 2),
-                        "total_found": len(breweries),
-                        "new_breweries": 0,
-                        "search_params": {
-                            "city": city,
-                            "state": state,
-                            "brewery_type": brewery_type,
-                            "brewery_name": brewery_name,
-                        },
-                    },
-                }
         else:
-            # No filtering - return all results
+            # No filtering (disabled or empty history) - return all results
             new_breweries = breweries
-            logger.info(f"Filtering disabled - returning all {len(breweries)} results")
+            logger.info(
+                "No history filtering - returning all %d results", len(breweries)
+            )
 
-        # Step 5: Format and return results
-        formatted_breweries = [self._format_brewery_result(b) for b in new_breweries]
-        execution_time = time.time() - start_time
+        # Step 5: Return the breweries to show; search_breweries formats them
+        filtered_out = len(breweries) - len(new_breweries)
+        selected = list(itertools.islice(new_breweries, limit or None))
+        execution_time = time.perf_counter() - start_time
 
-        logger.info(f"\n{'='*60}")
-        logger.info(f"BREWERY FINDER - Search completed successfully")
-        logger.info(f"   Total found: {len(breweries)}")
-        logger.info(f"   Returned: {len(formatted_breweries)}")
-        logger.info(f"   Filtered: {filter_history}")
-        logger.info(f"   Execution time: {execution_time:.2f}s")
-        logger.info(f"{'='*60}\n")
+        self._log_search_complete(
+            len(breweries), len(selected), filter_history, execution_time
+        )
 
         return {
             "status": "success",
-            "data": formatted_breweries,
-            "metadata": {
-                "timestamp": datetime.now().isoformat(),
-                "execution_time": round(execution_time, 2),
-                "total_found": len(breweries),
-                "new_breweries": len(formatted_breweries),
-                "filtered_out": len(breweries) - len(formatted_breweries),
-                "search_params": {
-                    "city": city,
-                    "state": state,
-                    "brewery_type": brewery_type,
-                    "history_size": len(brewery_history),
-                },
-            },
+            "data": selected,
+            "metadata": self._build_metadata(
+                start_time,
+                search_params,
+                total_found=len(breweries),
+                new_breweries=len(selected),
+                filtered_out=filtered_out,
+            ),
         }
 
+    def lookup_brewery_by_name(
+        self, brewery_name: str, limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Look up a brewery by name, without history filtering or metadata.
+
+        Specialized fast path for the common "tell me about brewery X" call: a
+        single API page of `limit` results, one fuzzy rerank (skipped when the
+        API returns a single hit) and formatting.
+
+        Args:
+            brewery_name: Brewery name to look up
+            limit: Maximum number of breweries to return (default: 5)
+
+        Returns:
+            Formatted breweries, best match first; empty if nothing was found or
+            the API call failed (the error is logged)
+
+        Example:
+            >>> finder = BreweryFinder()
+            >>> matches = finder.lookup_brewery_by_name("Stone Brewing")
+            >>> if matches:
+            ...     print(matches[0]["website_url"])
+        """
+        api_result = self._call_api(brewery_name=brewery_name, per_page=limit)
+        if api_result["status"] != "success":
+            return []
+
+        breweries = api_result["data"]
+        if len(breweries) > 1:
+            match_indices = self._best_name_matches(brewery_name, breweries, limit)
+            if match_indices:
+                breweries = [breweries[index] for index in match_indices]
+        return [self._format_brewery_result(b) for b in breweries[:limit]]
+
+    async def search_breweries_async(self, **query: Any) -> Dict[str, Any]:
+        """
+        Awaitable version of search_breweries for use inside an event loop.
+
+        The blocking search runs in a worker thread on the shared connection pool,
+        so the caller's loop stays free while the HTTP request is in flight. It
+        does not use an async HTTP client (httpx/aiohttp): a second client would
+        need its own copy of the response cache, retry policy and error mapping.
+        For N independent queries prefer search_many, which bounds concurrency.
+
+        Args:
+            **query: Keyword arguments accepted by search_breweries
+
+        Returns:
+            Search result dictionary (see search_breweries)
+        """
+        return await asyncio.to_thread(self.search_breweries, **query)
+
+    async def search_many(
+        self, queries: List[Dict[str, Any]], max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several brewery searches concurrently (e.g., multiple nearby cities).
+
+        Each query runs search_breweries in a worker thread, sharing the HTTP
+        connection pool, so N searches take about as long as the slowest one instead
+        of the sum of all of them.
+
+        This is not native async I/O: there is no aiohttp client. The blocking
+        urllib3 calls run on the event loop's default thread pool via
+        asyncio.to_thread, which keeps a single HTTP stack (pool, retries,
+        response cache, conditional GETs) for the sync and async paths. Actual
+        concurrency is therefore also bounded by that executor's size
+        (min(32, CPU count + 4) by default) and by the pool's maxsize of 32.
+
+        Args:
+            queries: List of keyword-argument dicts for search_breweries
+            max_concurrency: Maximum number of searches in flight at once
+
+        Returns:
+            List of search results, in the same order as queries
+
+        Example:
+            >>> finder = BreweryFinder()
+            >>> results = asyncio.run(finder.search_many([
+            ...     {"city": "San Diego", "state": "CA"},
+            ...     {"city": "Escondido", "state": "CA"},
+            ... ]))
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_query(query: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.search_breweries_async(**query)
+
+        return await asyncio.gather(*(run_query(q) for q in queries))
+
+
+# Shared finder so the connection pool and response cache persist across tool calls
+_DEFAULT_FINDER: Optional[BreweryFinder] = None
+_DEFAULT_FINDER_LOCK = threading.Lock()
+
+
+def _get_finder() -> BreweryFinder:
+    """
+    Return the process-wide BreweryFinder, creating it on first use.
+
+    Returns:
+        Shared BreweryFinder instance
+    """
+    global _DEFAULT_FINDER
+    if _DEFAULT_FINDER is None:
+        with _DEFAULT_FINDER_LOCK:
+            if _DEFAULT_FINDER is None:
+                _DEFAULT_FINDER = BreweryFinder()
+    return _DEFAULT_FINDER
+
 
 # Convenience function for direct usage
 def search_breweries_by_location_and_type(
@@ -496,6 +1225,7 @@ def search_breweries_by_location_and_type(
     brewery_history: Optional[List[str]] = None,
     brewery_name: Optional[str] = None,
     filter_history: bool = True,
+    limit: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Convenience function to search for breweries.
@@ -509,6 +1239,7 @@ def search_breweries_by_location_and_type(
         brewery_history: List of brewery names to exclude (only used if filter_history=True)
         brewery_name: Specific brewery name to search for
         filter_history: Whether to filter out breweries from history (default: True)
+        limit: Optional maximum number of breweries to return
 
     Returns:
         Search results dictionary
@@ -528,13 +1259,55 @@ def search_breweries_by_location_and_type(
         ...     filter_history=False
         ... )
     """
-    finder = BreweryFinder()
-    return finder.search_breweries(
-        city, state, brewery_type, brewery_history, brewery_name, filter_history
+    return _get_finder().search_breweries(
+        city, state, brewery_type, brewery_history, brewery_name, filter_history, limit
+    )
+
+
+def lookup_brewery_by_name(brewery_name: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Convenience function for a plain brewery name lookup (no history filtering).
+
+    Args:
+        brewery_name: Brewery name to look up
+        limit: Maximum number of breweries to return (default: 5)
+
+    Returns:
+        Formatted breweries, best match first (empty if none found)
+    """
+    return _get_finder().lookup_brewery_by_name(brewery_name, limit)
+
+
+def search_breweries_batch(
+    queries: List[Dict[str, Any]], max_concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Convenience function to run several brewery searches concurrently.
+
+    Must be called from synchronous code (it starts its own event loop);
+    async callers should await BreweryFinder.search_many directly.
+
+    Args:
+        queries: List of keyword-argument dicts for search_breweries
+        max_concurrency: Maximum number of searches in flight at once
+
+    Returns:
+        List of search results, in the same order as queries
+
+    Example:
+        >>> results = search_breweries_batch([
+        ...     {"city": "Bend", "state": "OR", "brewery_history": ["Deschutes Brewery"]},
+        ...     {"city": "Portland", "state": "OR"},
+        ... ])
+    """
+    return asyncio.run(
+        _get_finder().search_many(queries, max_concurrency=max_concurrency)
     )
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Demo/test usage
     print("\nBrewery Finder Tool - Demo\n")
 
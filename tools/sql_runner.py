@@ -2,8 +2,9 @@
 Tool 1: SQL Runner - Text-to-SQL for Client Knowledge
 
 This tool retrieves client information from the customers.db SQLite database (table: customers).
-It uses Gemini 2.5 Flash to generate SQL queries based on natural language input,
-with fallback logic for different search methods (client_id, postal_code, client_name).
+Profile lookups use fixed parameterized SQL with fallback logic for different search
+methods (client_id, postal_code, client_name). Analytical questions use Gemini 2.5 Flash
+to generate SQL queries based on natural language input.
 
 SECURITY: READ-ONLY MODE
 - Only SELECT queries are executed
@@ -19,26 +20,33 @@ PRIVACY RULES:
 3. Aggregate/Statistical Data: ALLOWED - "What's the most purchased beer in my state?" (anonymized)
 """
 
-import json
+import asyncio
+import copy
+import functools
+import hashlib
 import logging
 import os
-# Import prompt loader utility
-import sys
+import re
+import sqlite3
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from dotenv import load_dotenv
-from langchain_community.utilities import SQLDatabase
-from langchain_core.prompts import PromptTemplate
-from langchain_google_genai import ChatGoogleGenerativeAI
+import sqlglot
+from sqlglot import exp
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.prompt_loader import load_prompt
+from utils.semantic_cache import SemanticCache
+from utils.ttl_cache import TTLCache
 
-# Load environment variables from .env file
-load_dotenv()
+# orjson decodes the small JSON columns several times faster than the stdlib;
+# fall back to the stdlib when it is not installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -50,6 +58,246 @@ CUSTOMERS_SCHEMA = load_prompt("customers_schema.txt")
 # Load SQL generation prompt from external file
 SQL_GENERATION_PROMPT = load_prompt("sql_generation.txt")
 
+# The prompt is ordered static -> per-client -> per-question. Everything before
+# {session_context} is identical across calls; it is uploaded once as a Gemini
+# cached context and only the client context and question are sent per request
+_prompt_prefix, _, _prompt_rest = SQL_GENERATION_PROMPT.partition("{session_context}")
+SQL_GENERATION_PREFIX = _prompt_prefix.format(schema=CUSTOMERS_SCHEMA)
+SQL_GENERATION_SUFFIX = "{session_context}" + _prompt_rest
+
+# Columns stored as JSON arrays and decoded on read
+JSON_COLUMNS = ("top3_brewery_types", "top5_beers_recently", "top3_breweries_recently")
+# Explicit projection used when the caller does not ask for specific fields
+_DEFAULT_COLUMNS = (
+    "client_id",
+    "client_name",
+    "client_city",
+    "client_state",
+    "postal_code",
+) + JSON_COLUMNS
+
+# Profile lookups only ever need these query shapes, so they are written
+# directly (parameterized) instead of being generated by the LLM. Passing the same
+# string every call keeps the compiled statement hot in sqlite3's statement cache.
+# "combined" runs both searches in one round-trip, preferring the client_id match.
+_PROFILE_WHERE = {
+    "client_id": "client_id = ?",
+    "postal_code_and_name": "postal_code = ? AND LOWER(client_name) LIKE LOWER(?)",
+    "combined": (
+        "client_id = ? OR (postal_code = ? AND LOWER(client_name) LIKE LOWER(?)) "
+        "ORDER BY _matched_client_id DESC LIMIT 1"
+    ),
+}
+# Profile field names: a column, or a JSON column element such as "top5_beers_recently[0]"
+_FIELD_RE = re.compile(r"^(\w+)(?:\[(\d+)\])?$")
+# Markdown code fences around LLM-generated SQL (```sql ... ```)
+_FENCE_RE = re.compile(r"^```(?:sql)?\s*|\s*```$", re.MULTILINE)
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds elapsed since a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
+def _sql_end(text: str) -> int:
+    """
+    Find where the first complete SQL statement ends in (partial) LLM output.
+
+    The statement ends at the first ';' outside a string literal or, when the
+    output opens with a markdown fence, at the closing fence.
+
+    Args:
+        text: LLM output received so far
+
+    Returns:
+        Index just past the end of the statement, or -1 if it is not complete yet
+    """
+    i = len(text) - len(text.lstrip())
+    fenced = text.startswith("```", i)
+    if fenced:
+        i = text.find("\n", i) + 1
+        if i == 0:
+            return -1
+
+    quote = None
+    while i < len(text):
+        char = text[i]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == ";":
+            return i + 1
+        elif fenced and text.startswith("```", i):
+            return i + 3
+        i += 1
+    return -1
+
+
+def _context_cache_gone(error: Exception) -> bool:
+    """
+    Tell whether a Gemini error means the cached context no longer exists.
+
+    Gemini answers requests for a deleted or expired cached content with
+    404 NOT_FOUND, or 403 when it cannot tell the two apart.
+
+    Args:
+        error: Exception raised by a request that referenced the cached context
+
+    Returns:
+        True if the cache must be recreated, False for unrelated (e.g. transient)
+        failures
+    """
+    if getattr(error, "code", None) in (403, 404):
+        return True
+    message = str(error).lower()
+    return "cache" in message and ("not found" in message or "expired" in message)
+
+
+# Statements (or nested expressions) that modify data or the database itself;
+# Command covers statements sqlglot only recognises by keyword (REPLACE, VACUUM, ...)
+_MODIFYING_NODES = (
+    exp.Insert,
+    exp.Update,
+    exp.Delete,
+    exp.Merge,
+    exp.Drop,
+    exp.Create,
+    exp.Alter,
+    exp.TruncateTable,
+    exp.Attach,
+    exp.Detach,
+    exp.Pragma,
+    exp.Command,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_read_only(sql_query: str) -> Tuple[Optional[exp.Expression], str]:
+    """
+    Parse SQL and check that it is a single read-only SELECT.
+
+    Results are memoized per query string, so the fixed profile lookups are
+    only parsed once. The returned tree is shared and must not be modified.
+
+    Args:
+        sql_query: SQL query to validate
+
+    Returns:
+        Tuple of (syntax tree, error message): the tree is None and the message
+        describes the violation when the query is not allowed
+    """
+    try:
+        statements = [
+            statement
+            for statement in sqlglot.parse(sql_query, read="sqlite")
+            if statement is not None and not isinstance(statement, exp.Semicolon)
+        ]
+    except sqlglot.errors.SqlglotError as e:
+        return None, f"SECURITY VIOLATION: Query could not be parsed ({e})."
+
+    if len(statements) > 1:
+        return (
+            None,
+            "SECURITY VIOLATION: Multi-statement queries detected. Only single SELECT queries are allowed.",
+        )
+
+    tree = statements[0] if statements else None
+    modifying = tree.find(*_MODIFYING_NODES) if tree is not None else None
+    if modifying is not None:
+        command = (
+            modifying.name if isinstance(modifying, exp.Command) else modifying.key
+        )
+        return (
+            None,
+            f"SECURITY VIOLATION: '{command.upper()}' command is not allowed. Only SELECT queries are permitted.",
+        )
+
+    if not isinstance(tree, (exp.Select, exp.SetOperation)):
+        return (
+            None,
+            "SECURITY VIOLATION: Only SELECT queries are allowed. Query must start with SELECT.",
+        )
+
+    return tree, ""
+
+
+def _decode_json_column(value: bytes) -> Any:
+    """sqlite3 converter for JSON columns selected as '<column> [json]'."""
+    return _json_loads(value)
+
+
+sqlite3.register_converter("json", _decode_json_column)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_profile_sql(
+    search_method: str, fields: Tuple[str, ...] = _DEFAULT_COLUMNS
+) -> str:
+    """
+    Build the profile lookup SQL for a search method and column projection.
+
+    JSON columns are aliased as '<column> [json]' so the registered converter decodes
+    them while fetching. Element fields like 'top5_beers_recently[0]' are extracted by
+    SQLite's json_extract() and returned as '<column>_<index>'. The 'combined'
+    query also selects a '_matched_client_id' flag telling which search matched.
+
+    Args:
+        search_method: One of 'client_id', 'postal_code_and_name', 'combined'
+        fields: Columns (or JSON column elements) to select
+
+    Returns:
+        SQL query with ? placeholders
+
+    Raises:
+        ValueError: If a field is not a known column or JSON column element
+    """
+    select_list = []
+    for field in fields:
+        match = _FIELD_RE.match(field)
+        column, index = match.groups() if match else (None, None)
+        if column not in _DEFAULT_COLUMNS or (
+            index is not None and column not in JSON_COLUMNS
+        ):
+            raise ValueError(f"Invalid profile field: {field}")
+
+        if index is not None:
+            select_list.append(
+                f"json_extract({column}, '$[{index}]') AS {column}_{index}"
+            )
+        elif column in JSON_COLUMNS:
+            select_list.append(f'{column} AS "{column} [json]"')
+        else:
+            select_list.append(column)
+
+    if search_method == "combined":
+        select_list.append("client_id = ? AS _matched_client_id")
+
+    return (
+        f"SELECT {', '.join(select_list)} FROM customers "
+        f"WHERE {_PROFILE_WHERE[search_method]}"
+    )
+
+
+PROFILE_QUERIES = {method: _build_profile_sql(method) for method in _PROFILE_WHERE}
+_SQL_CLIENT_LOCATION = (
+    "SELECT client_city, client_state FROM customers WHERE client_id = ?"
+)
+
+# Indexes backing the lookups above and the "my city/state" analytical filters.
+# client_id needs none: as the PRIMARY KEY it already has an automatic index.
+CUSTOMER_INDEXES = {
+    "idx_customers_postal_name": (
+        "CREATE INDEX IF NOT EXISTS idx_customers_postal_name "
+        "ON customers(postal_code, client_name COLLATE NOCASE)"
+    ),
+    "idx_customers_city_state": (
+        "CREATE INDEX IF NOT EXISTS idx_customers_city_state "
+        "ON customers(client_city, client_state)"
+    ),
+}
+
 
 class SQLRunner:
     """
@@ -61,23 +309,26 @@ class SQLRunner:
     - All modification commands (INSERT, UPDATE, DELETE, DROP, TRUNCATE, ALTER, etc.) are blocked
     """
 
-    # Forbidden SQL keywords that modify data
-    FORBIDDEN_KEYWORDS = [
-        "insert",
-        "update",
-        "delete",
-        "drop",
-        "truncate",
-        "alter",
-        "create",
-        "replace",
-        "rename",
-        "grant",
-        "revoke",
-        "attach",
-        "detach",
-        "pragma",
-    ]
+    # Found profiles are reused for a while per lookup arguments (agent turns re-fetch them)
+    PROFILE_CACHE_SIZE = 512
+    PROFILE_CACHE_TTL = 300
+    # City/state context of authenticated clients, looked up on every analytical query
+    LOCATION_CACHE_SIZE = 1024
+    LOCATION_CACHE_TTL = 300
+    # Rows returned by analytical SQL, keyed by client and whitespace-normalized SQL
+    RESULT_CACHE_SIZE = 2048
+    RESULT_CACHE_TTL = 300
+    # Rows fetched per round trip when reading analytical results
+    FETCH_BATCH_SIZE = 1000
+
+    GEMINI_MODEL = "gemini-2.5-flash"
+    # Lifetime of the Gemini cached context holding the schema/instructions prefix
+    CONTEXT_CACHE_TTL = 3600
+
+    # Generated analytical SQL is reused for paraphrased questions from the same client
+    EMBEDDING_MODEL = "models/embedding-001"
+    SEMANTIC_CACHE_THRESHOLD = 0.95
+    SEMANTIC_CACHE_SIZE = 10000
 
     def __init__(
         self, database_path: str = "data/customers.db", api_key: Optional[str] = None
@@ -87,35 +338,394 @@ class SQLRunner:
 
         Args:
             database_path: Path to SQLite database file
-            api_key: Google API Key (if not provided, reads from GOOGLE_API_KEY env var)
+            api_key: Google API Key (if not provided, reads from GOOGLE_API_KEY env var
+                when the LLM is first needed)
         """
         self.database_path = database_path
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
 
+        # One-time migration, then persistent read-only connections (one per
+        # thread, so concurrent lookups do not serialize on a single connection)
+        self._ensure_indexes(database_path)
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._thread_connection()  # Open now so a bad database path fails fast
+        self._profile_cache = TTLCache(
+            maxsize=self.PROFILE_CACHE_SIZE, ttl=self.PROFILE_CACHE_TTL
+        )
+        self._location_cache = TTLCache(
+            maxsize=self.LOCATION_CACHE_SIZE, ttl=self.LOCATION_CACHE_TTL
+        )
+        self._result_cache = TTLCache(
+            maxsize=self.RESULT_CACHE_SIZE, ttl=self.RESULT_CACHE_TTL
+        )
+
+        # The Gemini model is only needed for analytical queries, so it (and its
+        # heavy imports) is created on first use
+        self._llm = None
+
+        # Gemini context cache for the static prompt prefix (see _generate_sql)
+        self._genai_client = None
+        self._cached_context: Optional[str] = None
+        self._cached_context_expires = 0.0
+        self._context_cache_disabled = False
+        self._context_lock = threading.Lock()
+
+        # Semantic cache of generated analytical SQL, scoped per client
+        self._embeddings = None
+        self._sql_cache = SemanticCache(
+            self._embed_question,
+            threshold=self.SEMANTIC_CACHE_THRESHOLD,
+            maxsize=self.SEMANTIC_CACHE_SIZE,
+        )
+
+        logger.info(f"SQL Runner initialized with database: {database_path}")
+
+    def _require_api_key(self) -> str:
+        """
+        Return the Google API key, loading .env if it is not in the environment yet.
+
+        Returns:
+            Google API key
+
+        Raises:
+            ValueError: If no key is configured
+        """
+        if not self.api_key:
+            from dotenv import load_dotenv
+
+            load_dotenv()
+            self.api_key = os.getenv("GOOGLE_API_KEY")
         if not self.api_key:
             raise ValueError("GOOGLE_API_KEY not found in environment variables")
+        return self.api_key
+
+    @property
+    def llm(self):
+        """Gemini chat model, created on first access."""
+        if self._llm is None:
+            self._require_api_key()
+
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
+            self._llm = ChatGoogleGenerativeAI(
+                model=self.GEMINI_MODEL, temperature=0, google_api_key=self.api_key
+            )
+        return self._llm
+
+    @llm.setter
+    def llm(self, value) -> None:
+        self._llm = value
+
+    @staticmethod
+    def _ensure_indexes(database_path: str) -> None:
+        """
+        Create missing lookup indexes and refresh planner statistics.
+
+        The runner itself only reads, so this uses a separate short-lived
+        read-write connection and does nothing when all indexes already exist.
+        The connection is opened with mode=rw, which never creates the file:
+        a wrong path is left to fail when the read-only connection opens.
+
+        Args:
+            database_path: Path to SQLite database file
+        """
+        try:
+            db_uri = f"{Path(database_path).resolve().as_uri()}?mode=rw"
+            conn = sqlite3.connect(db_uri, uri=True)
+            try:
+                existing = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'index'"
+                    )
+                }
+                missing = [
+                    sql
+                    for name, sql in CUSTOMER_INDEXES.items()
+                    if name not in existing
+                ]
+                if not missing:
+                    return
+                for sql in missing:
+                    conn.execute(sql)
+                conn.execute("ANALYZE")
+                conn.commit()
+                logger.info(f"Created {len(missing)} customer indexes")
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            # Queries still work without indexes, just slower
+            logger.warning(f"Could not create customer indexes: {e}")
+
+    @staticmethod
+    def _connect_read_only(database_path: str) -> sqlite3.Connection:
+        """
+        Open a read-only SQLite connection tuned for repeated lookups.
 
-        # Initialize database connection
-        db_uri = f"sqlite:///{database_path}"
-        self.db = SQLDatabase.from_uri(db_uri)
+        Args:
+            database_path: Path to SQLite database file
 
-        # Initialize Gemini model
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash", temperature=0, google_api_key=self.api_key
+        Returns:
+            sqlite3 connection returning sqlite3.Row rows
+        """
+        db_uri = f"{Path(database_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(
+            db_uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=256,
+            detect_types=sqlite3.PARSE_COLNAMES,
         )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA cache_size = -65536")
+        return conn
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """
+        Return the calling thread's read-only connection, opening it on first use.
+
+        Returns:
+            sqlite3 connection owned by the current thread
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect_read_only(self.database_path)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        """Read-only connection of the calling thread."""
+        return self._thread_connection()
+
+    def clear_cache(self) -> None:
+        """Drop all cached client profiles and locations (call after writing data)."""
+        self._profile_cache.clear()
+        self._location_cache.clear()
+        self._result_cache.clear()
+        self._sql_cache.clear()
+        logger.info("SQL Runner profile cache cleared")
+
+    def close(self) -> None:
+        """Close the database connections of all threads."""
+        lock = getattr(self, "_connections_lock", None)
+        if lock is None:
+            return
+        with lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+
+    def __enter__(self) -> "SQLRunner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def _get_cached_context(self) -> Optional[str]:
+        """
+        Return the name of the Gemini cached context holding the static prompt prefix.
+
+        The cache is created on first use and recreated shortly before it expires.
+        If creation fails (e.g. the prefix is below the model's minimum cacheable
+        size), context caching is disabled for this runner and None is returned.
 
-        # Create SQL query chain
-        self.prompt = PromptTemplate(
-            template=SQL_GENERATION_PROMPT, input_variables=["schema", "question"]
+        Returns:
+            Cached content name, or None if context caching is unavailable
+        """
+        if self._context_cache_disabled:
+            return None
+
+        with self._context_lock:
+            # Refresh a minute early so requests never reference an expired cache
+            if self._cached_context and time.monotonic() < (
+                self._cached_context_expires - 60
+            ):
+                return self._cached_context
+
+            try:
+                from google import genai
+                from google.genai import types
+
+                if self._genai_client is None:
+                    self._genai_client = genai.Client(api_key=self._require_api_key())
+
+                cache = self._genai_client.caches.create(
+                    model=self.GEMINI_MODEL,
+                    config=types.CreateCachedContentConfig(
+                        contents=[SQL_GENERATION_PREFIX],
+                        display_name="sql-runner-prompt-prefix",
+                        ttl=f"{self.CONTEXT_CACHE_TTL}s",
+                    ),
+                )
+                self._cached_context = cache.name
+                self._cached_context_expires = time.monotonic() + self.CONTEXT_CACHE_TTL
+                logger.info(f"Created Gemini context cache: {cache.name}")
+            except Exception as e:
+                code = getattr(e, "code", None)
+                if isinstance(e, (ImportError, ValueError)) or (
+                    isinstance(code, int) and 400 <= code < 500
+                ):
+                    # Rejected request (e.g. prefix below the minimum size)
+                    logger.warning(
+                        f"Gemini context caching unavailable, sending full prompts: {e}"
+                    )
+                    self._context_cache_disabled = True
+                    self._cached_context = None
+                else:
+                    # Transient failure: keep the current cache until it expires
+                    logger.warning(f"Gemini context cache refresh failed: {e}")
+                    if time.monotonic() >= self._cached_context_expires:
+                        self._cached_context = None
+
+            return self._cached_context
+
+    def _generate_sql(self, session_context: str, question: str) -> str:
+        """
+        Ask Gemini for SQL answering the question.
+
+        Uses the cached schema/instructions prefix when available so only the
+        client context and question are sent; otherwise falls back to the full
+        prompt via LangChain. The response is streamed and reading stops at the
+        end of the first complete statement, skipping any trailing explanation.
+
+        Args:
+            session_context: Authenticated client context (see _session_context)
+            question: Natural language question, always the last part of the prompt
+
+        Returns:
+            Raw model output (may still contain markdown fences)
+        """
+        cached_context = self._get_cached_context()
+        if cached_context:
+            try:
+                from google.genai import types
+
+                stream = self._genai_client.models.generate_content_stream(
+                    model=self.GEMINI_MODEL,
+                    contents=SQL_GENERATION_SUFFIX.format(
+                        session_context=session_context, question=question
+                    ),
+                    config=types.GenerateContentConfig(
+                        cached_content=cached_context, temperature=0
+                    ),
+                )
+                text = ""
+                usage = None
+                for chunk in stream:
+                    text += chunk.text or ""
+                    usage = chunk.usage_metadata or usage
+                    end = _sql_end(text)
+                    if end != -1:
+                        text = text[:end]
+                        break
+                if usage:
+                    logger.info(
+                        f"Gemini prompt tokens: {usage.prompt_token_count} "
+                        f"(cached: {usage.cached_content_token_count or 0})"
+                    )
+                return text
+            except Exception as e:
+                logger.warning(f"Cached-context generation failed, retrying: {e}")
+                if _context_cache_gone(e):
+                    with self._context_lock:
+                        # Another thread may already have created a new one
+                        if self._cached_context == cached_context:
+                            self._cached_context = None
+
+        # Schema is already baked into the prefix; only the tail is formatted
+        prompt_value = SQL_GENERATION_PREFIX + SQL_GENERATION_SUFFIX.format(
+            session_context=session_context, question=question
         )
+        text = ""
+        for chunk in self.llm.stream(prompt_value):
+            text += chunk.content
+            end = _sql_end(text)
+            if end != -1:
+                return text[:end]
+        return text
+
+    def _session_context(self, client_id: str) -> str:
+        """
+        Build the prompt context for the authenticated client.
 
-        logger.info(f"SQL Runner initialized with database: {database_path}")
+        It only depends on the client (city/state come from the location cache),
+        so it stays identical across that client's questions.
+
+        Args:
+            client_id: Authenticated client ID
+
+        Returns:
+            Context text placed between the static rules and the question
+        """
+        client_profile = self._get_client_location(client_id)
+        if not client_profile:
+            return f"AUTHENTICATED CLIENT: {client_id} (queries about this client's own data are allowed)"
+
+        client_city = client_profile.get("client_city", "Unknown")
+        client_state = client_profile.get("client_state", "Unknown")
+        return f"""AUTHENTICATED CLIENT CONTEXT:
+- Client ID: {client_id} (queries about this client's own data are allowed)
+- City: {client_city}
+- State: {client_state} (FULL NAME, not abbreviation)
+
+CRITICAL RULES FOR CITY QUERIES:
+- When user asks about "my city" or references city data, ALWAYS filter by BOTH city AND state
+- Use: WHERE client_city = '{client_city}' AND client_state = '{client_state}'
+- NEVER filter by city alone (multiple cities can have same name in different states)
+- State is stored as FULL NAME '{client_state}', NOT as abbreviation"""
+
+    def _embed_question(self, text: str) -> List[float]:
+        """Embed a question for the semantic SQL cache (model created on first use)."""
+        if self._embeddings is None:
+            from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+            self._embeddings = GoogleGenerativeAIEmbeddings(
+                model=self.EMBEDDING_MODEL, google_api_key=self._require_api_key()
+            )
+        return self._embeddings.embed_query(text)
+
+    def _get_cached_sql(self, question: str, client_id: str) -> Optional[str]:
+        """
+        Return SQL generated earlier for a similar question from the same client.
+
+        Args:
+            question: Natural language question
+            client_id: Authenticated client the SQL was generated for
+
+        Returns:
+            Cached SQL query, or None on a miss (or if embedding fails)
+        """
+        try:
+            return self._sql_cache.get(question.strip(), scope=client_id)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+    def _cache_sql(self, question: str, client_id: str, sql_query: str) -> None:
+        """Store generated SQL in the semantic cache, ignoring embedding failures."""
+        try:
+            self._sql_cache.set(question.strip(), sql_query, scope=client_id)
+        except Exception as e:
+            logger.warning(f"Semantic cache update failed: {e}")
 
     def _validate_read_only(self, sql_query: str) -> tuple[bool, str]:
         """
         Validate that SQL query is read-only (SELECT only).
 
-        Security check to prevent any data modification commands.
+        Security check to prevent any data modification commands. The query is
+        parsed with sqlglot rather than scanned for keywords, so only the actual
+        statement structure matters (column names or string literals never trip it).
 
         Args:
             sql_query: SQL query to validate
@@ -125,36 +735,11 @@ class SQLRunner:
             - is_valid: True if query is safe (SELECT only), False otherwise
             - error_message: Empty string if valid, error description if invalid
         """
-        sql_lower = sql_query.lower().strip()
-
-        # Remove comments and extra whitespace
-        sql_normalized = " ".join(sql_lower.split())
-
-        # Check for forbidden keywords
-        for keyword in self.FORBIDDEN_KEYWORDS:
-            if keyword in sql_normalized:
-                error_msg = f"SECURITY VIOLATION: '{keyword.upper()}' command is not allowed. Only SELECT queries are permitted."
-                logger.error(error_msg)
-                return False, error_msg
-
-        # Ensure query starts with SELECT (after removing leading whitespace/comments)
-        if not sql_normalized.startswith("select"):
-            error_msg = "SECURITY VIOLATION: Only SELECT queries are allowed. Query must start with SELECT."
+        tree, error_msg = _parse_read_only(sql_query)
+        if tree is None:
             logger.error(error_msg)
             return False, error_msg
 
-        # Additional check: look for semicolon followed by forbidden keywords (multi-statement injection)
-        if ";" in sql_normalized:
-            parts = sql_normalized.split(";")
-            for part in parts:
-                part = part.strip()
-                if not part:  # Empty after semicolon is OK
-                    continue
-                if not part.startswith("select"):
-                    error_msg = "SECURITY VIOLATION: Multi-statement queries detected. Only single SELECT queries are allowed."
-                    logger.error(error_msg)
-                    return False, error_msg
-
         return True, ""
 
     def _generate_query(
@@ -163,47 +748,52 @@ class SQLRunner:
         search_method: str,
         postal_code: str = None,
         client_name: str = None,
-    ) -> str:
+        fields: Tuple[str, ...] = _DEFAULT_COLUMNS,
+    ) -> Tuple[str, Tuple[str, ...]]:
         """
-        Generate SQL query using Gemini based on search method.
+        Build the parameterized SQL query for a profile search method.
+
+        Profile lookups never call the LLM; free-form natural-language questions
+        are handled by run_analytical_query, the only Gemini-backed SQL path.
 
         Args:
-            search_input: The value to search for (used for client_id)
-            search_method: One of 'client_id', 'postal_code_and_name'
-            postal_code: Postal code (used when search_method is 'postal_code_and_name')
-            client_name: Client name (used when search_method is 'postal_code_and_name')
+            search_input: The value to search for (used for client_id and combined)
+            search_method: One of 'client_id', 'postal_code_and_name', 'combined'
+            postal_code: Postal code (used by 'postal_code_and_name' and 'combined')
+            client_name: Client name (used by 'postal_code_and_name' and 'combined')
+            fields: Columns (or JSON column elements) to select
 
         Returns:
-            Generated SQL query string
+            Tuple of (SQL query with ? placeholders, parameters)
+
+        Raises:
+            ValueError: If search_method is not a profile search method
         """
         if search_method == "client_id":
-            question = f"Find the client profile where client_id is '{search_input}'"
+            params = (search_input,)
         elif search_method == "postal_code_and_name":
-            question = f"Find the client profile where postal_code is '{postal_code}' AND client_name contains '{client_name}' (case-insensitive)"
+            params = (postal_code, f"%{client_name}%")
+        elif search_method == "combined":
+            params = (search_input, search_input, postal_code, f"%{client_name}%")
         else:
-            raise ValueError(f"Invalid search method: {search_method}")
-
-        # Generate SQL using LLM
-        prompt_value = self.prompt.format(schema=CUSTOMERS_SCHEMA, question=question)
-        response = self.llm.invoke(prompt_value)
-        sql_query = response.content.strip()
-
-        # Clean up the query (remove markdown code blocks if present)
-        if sql_query.startswith("```sql"):
-            sql_query = sql_query.replace("```sql", "").replace("```", "").strip()
-        elif sql_query.startswith("```"):
-            sql_query = sql_query.replace("```", "").strip()
+            raise ValueError(
+                f"Invalid search method: {search_method} "
+                "(use run_analytical_query for free-form questions)"
+            )
 
-        return sql_query
+        return _build_profile_sql(search_method, fields), params
 
-    def _execute_query(self, sql_query: str) -> Optional[Dict[str, Any]]:
+    def _execute_query(
+        self, sql_query: str, params: Tuple[Any, ...] = ()
+    ) -> Optional[Dict[str, Any]]:
         """
         Execute SQL query and return result.
 
         SECURITY: Validates that query is read-only before execution.
 
         Args:
-            sql_query: SQL query to execute
+            sql_query: SQL query to execute (may use ? placeholders)
+            params: Values bound to the query placeholders
 
         Returns:
             Dictionary with query result or None if no results
@@ -215,45 +805,15 @@ class SQLRunner:
                 logger.error(f"Query rejected: {error_msg}")
                 logger.error(f"Rejected SQL: {sql_query}")
                 return None
-            result = self.db.run(sql_query)
-
-            # Parse the result (SQLDatabase.run returns string representation)
-            if not result or result == "[]":
-                return None
-
-            # The result is typically a string like: "[('C001', 'Bar do João', ...)]"
-            # We need to parse it properly
-            # For now, let's execute directly with sqlite3 for better control
-            import sqlite3
-
-            conn = sqlite3.connect(self.database_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute(sql_query)
-            row = cursor.fetchone()
-            conn.close()
 
-            if not row:
+            # Single execute; fetchone() returns None when nothing matches
+            row = self._conn.execute(sql_query, params).fetchone()
+            if row is None:
                 return None
 
             # Convert to dictionary
             result_dict = dict(row)
 
-            # Parse JSON columns
-            if result_dict.get("top3_brewery_types"):
-                result_dict["top3_brewery_types"] = json.loads(
-                    result_dict["top3_brewery_types"]
-                )
-            if result_dict.get("top5_beers_recently"):
-                result_dict["top5_beers_recently"] = json.loads(
-                    result_dict["top5_beers_recently"]
-                )
-            if result_dict.get("top3_breweries_recently"):
-                result_dict["top3_breweries_recently"] = json.loads(
-                    result_dict["top3_breweries_recently"]
-                )
-
             # Create combined location field for backward compatibility
             if result_dict.get("client_city") and result_dict.get("client_state"):
                 result_dict["client_location_city_state"] = (
@@ -266,11 +826,208 @@ class SQLRunner:
             logger.error(f"Error executing query: {e}")
             return None
 
+    def _get_client_location(self, client_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the city/state of a client, cached per client_id.
+
+        Args:
+            client_id: Client ID to look up
+
+        Returns:
+            Dictionary with client_city and client_state, or None if not found
+        """
+        location = self._location_cache.get(client_id)
+        if location is None:
+            location = self._execute_query(_SQL_CLIENT_LOCATION, (client_id,))
+            if location:
+                self._location_cache.set(client_id, location)
+        return location
+
+    def _search_by_client_id(
+        self, client_id: str, fields: Tuple[str, ...]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up a client profile by client_id.
+
+        Args:
+            client_id: Client ID to search for
+            fields: Columns (or JSON column elements) to select
+
+        Returns:
+            Tuple of (SQL query, profile or None)
+        """
+        sql_query, result = None, None
+        try:
+            logger.info(f"Attempting search by client_id: {client_id}")
+            sql_query, params = self._generate_query(
+                client_id, "client_id", fields=fields
+            )
+            logger.info(f"Generated SQL: {sql_query}")
+            result = self._execute_query(sql_query, params)
+            if result:
+                logger.info(
+                    f"Found client by client_id: {result.get('client_name', client_id)}"
+                )
+        except Exception as e:
+            logger.error(f"Error searching by client_id: {e}")
+        return sql_query, result
+
+    def _search_by_postal_code_and_name(
+        self, postal_code: str, client_name: str, fields: Tuple[str, ...]
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up a client profile by postal_code AND (partial) client_name.
+
+        Args:
+            postal_code: Postal code to search for
+            client_name: Client name to search for
+            fields: Columns (or JSON column elements) to select
+
+        Returns:
+            Tuple of (SQL query, profile or None)
+        """
+        sql_query, result = None, None
+        try:
+            logger.info(
+                f"Attempting fallback search by postal_code AND client_name: {postal_code} + {client_name}"
+            )
+            sql_query, params = self._generate_query(
+                search_input=None,
+                search_method="postal_code_and_name",
+                postal_code=postal_code,
+                client_name=client_name,
+                fields=fields,
+            )
+            logger.info(f"Generated SQL: {sql_query}")
+            result = self._execute_query(sql_query, params)
+            if result:
+                logger.info(
+                    "Found client by postal_code AND client_name: "
+                    f"{result.get('client_name', client_name)}"
+                )
+        except Exception as e:
+            logger.error(f"Error searching by postal_code AND client_name: {e}")
+        return sql_query, result
+
+    def _search_combined(
+        self,
+        client_id: str,
+        postal_code: str,
+        client_name: str,
+        fields: Tuple[str, ...],
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]], str]:
+        """
+        Look up a profile by client_id OR postal_code AND client_name in one query.
+
+        Equivalent to the client_id search followed by the fallback search, but
+        with a single database round-trip; a client_id match takes precedence.
+
+        Args:
+            client_id: Client ID to search for
+            postal_code: Postal code to search for
+            client_name: Client name to search for
+            fields: Columns (or JSON column elements) to select
+
+        Returns:
+            Tuple of (SQL query, profile or None, search method that matched)
+        """
+        sql_query, result, search_method = None, None, "not_found"
+        try:
+            logger.info(
+                f"Attempting combined search: {client_id} | {postal_code} + {client_name}"
+            )
+            sql_query, params = self._generate_query(
+                client_id,
+                "combined",
+                postal_code=postal_code,
+                client_name=client_name,
+                fields=fields,
+            )
+            logger.info(f"Generated SQL: {sql_query}")
+            result = self._execute_query(sql_query, params)
+            if result:
+                search_method = (
+                    "client_id"
+                    if result.pop("_matched_client_id")
+                    else "postal_code_and_name"
+                )
+                logger.info(f"Found client by {search_method}")
+        except Exception as e:
+            logger.error(f"Error in combined search: {e}")
+        return sql_query, result, search_method
+
+    @staticmethod
+    def _profile_cache_key(
+        client_id: Optional[str],
+        postal_code: Optional[str],
+        client_name: Optional[str],
+        fields: Tuple[str, ...],
+    ) -> Tuple[str, str, str, Tuple[str, ...]]:
+        """Key of a profile lookup in the profile cache (name matching is case-insensitive)."""
+        return (client_id or "", postal_code or "", (client_name or "").lower(), fields)
+
+    def _profile_response(
+        self,
+        sql_query: Optional[str],
+        search_method: str,
+        result: Optional[Dict[str, Any]],
+        start_ns: int,
+        timestamp: str,
+        cache_key: Optional[Tuple] = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the get_client_profile response dictionary.
+
+        Found profiles are stored in the profile cache under cache_key, so a
+        repeated lookup with the same arguments skips the database.
+        """
+        if not result:
+            logger.warning("WARNING: Client not found with provided search criteria")
+        elif cache_key is not None:
+            # Cached and served as copies, so callers cannot change each other's data
+            self._profile_cache.set(
+                cache_key, (sql_query, search_method, copy.deepcopy(result))
+            )
+
+        return {
+            "sql_query": sql_query,
+            "search_method": search_method,
+            "result": result,
+            "source": "database",
+            "execution_time_ms": _elapsed_ms(start_ns),
+            "timestamp": timestamp,
+        }
+
+    def _cached_profile_response(
+        self, cache_key: Tuple, start_ns: int, timestamp: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build a get_client_profile response from the profile cache.
+
+        Returns:
+            Response with source 'cache_hit', or None if the lookup is not cached
+        """
+        cached = self._profile_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        sql_query, search_method, result = cached
+        logger.info(f"Profile cache hit: {result.get('client_name', search_method)}")
+        return {
+            "sql_query": sql_query,
+            "search_method": search_method,
+            "result": copy.deepcopy(result),
+            "source": "cache_hit",
+            "execution_time_ms": _elapsed_ms(start_ns),
+            "timestamp": timestamp,
+        }
+
     def get_client_profile(
         self,
         client_id: Optional[str] = None,
         postal_code: Optional[str] = None,
         client_name: Optional[str] = None,
+        fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Retrieve client profile with fallback logic.
@@ -279,75 +1036,140 @@ class SQLRunner:
         1. client_id (if provided) - primary unique identifier
         2. postal_code AND client_name (if both provided and client_id failed) - combined fallback
 
+        When all three are provided, both searches run as a single query.
+
         Args:
             client_id: Client ID to search for (primary identifier)
             postal_code: Postal code to search for (used with client_name for fallback)
             client_name: Client name to search for (used with postal_code for fallback)
+            fields: Columns to return (default: all). JSON column elements can be
+                selected directly, e.g. 'top5_beers_recently[0]' is returned as
+                'top5_beers_recently_0'
 
         Returns:
             Dictionary with:
             - sql_query: The SQL query that was executed
             - search_method: The method used ('client_id', 'postal_code_and_name', 'not_found')
             - result: The client profile data or None
+            - source: 'cache_hit' if served from the profile cache, else 'database'
             - execution_time_ms: Time taken to execute
             - timestamp: ISO timestamp of execution
+
+        Raises:
+            ValueError: If fields contains an unknown column
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         timestamp = datetime.now().isoformat()
 
+        fields = tuple(fields) if fields else _DEFAULT_COLUMNS
+        _build_profile_sql("client_id", fields)  # Validate fields up front
+
+        cache_key = self._profile_cache_key(client_id, postal_code, client_name, fields)
+        cached_response = self._cached_profile_response(cache_key, start_ns, timestamp)
+        if cached_response is not None:
+            return cached_response
+
         result = None
         sql_query = None
         search_method = "not_found"
 
+        # All criteria given: one round-trip, client_id match preferred
+        if client_id and postal_code and client_name:
+            sql_query, result, search_method = self._search_combined(
+                client_id, postal_code, client_name, fields
+            )
+            return self._profile_response(
+                sql_query, search_method, result, start_ns, timestamp, cache_key
+            )
+
         # Try client_id first (primary identifier)
         if client_id:
-            try:
-                logger.info(f"Attempting search by client_id: {client_id}")
-                sql_query = self._generate_query(client_id, "client_id")
-                logger.info(f"Generated SQL: {sql_query}")
-                result = self._execute_query(sql_query)
-                if result:
-                    search_method = "client_id"
-                    logger.info(f"Found client by client_id: {result['client_name']}")
-            except Exception as e:
-                logger.error(f"Error searching by client_id: {e}")
+            sql_query, result = self._search_by_client_id(client_id, fields)
+            if result:
+                search_method = "client_id"
 
         # Fallback to postal_code AND client_name (combined search)
         if not result and postal_code and client_name:
-            try:
-                logger.info(
-                    f"Attempting fallback search by postal_code AND client_name: {postal_code} + {client_name}"
-                )
-                sql_query = self._generate_query(
-                    search_input=None,
-                    search_method="postal_code_and_name",
-                    postal_code=postal_code,
-                    client_name=client_name,
-                )
-                logger.info(f"Generated SQL: {sql_query}")
-                result = self._execute_query(sql_query)
-                if result:
-                    search_method = "postal_code_and_name"
-                    logger.info(
-                        f"Found client by postal_code AND client_name: {result['client_name']}"
-                    )
-            except Exception as e:
-                logger.error(f"Error searching by postal_code AND client_name: {e}")
+            sql_query, result = self._search_by_postal_code_and_name(
+                postal_code, client_name, fields
+            )
+            if result:
+                search_method = "postal_code_and_name"
 
-        execution_time_ms = (time.time() - start_time) * 1000
+        return self._profile_response(
+            sql_query, search_method, result, start_ns, timestamp, cache_key
+        )
 
-        response = {
-            "sql_query": sql_query,
-            "search_method": search_method,
-            "result": result,
-            "execution_time_ms": execution_time_ms,
-            "timestamp": timestamp,
-        }
+    async def get_client_profile_async(
+        self,
+        client_id: Optional[str] = None,
+        postal_code: Optional[str] = None,
+        client_name: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Awaitable version of get_client_profile for use inside an event loop.
 
-        if not result:
-            logger.warning("WARNING: Client not found with provided search criteria")
+        When client_id and postal_code + client_name are all given, both lookups run
+        concurrently in worker threads instead of the fallback waiting for the
+        primary miss. A client_id match still takes precedence.
+
+        Args:
+            client_id: Client ID to search for (primary identifier)
+            postal_code: Postal code to search for (used with client_name for fallback)
+            client_name: Client name to search for (used with postal_code for fallback)
+            fields: Columns to return (default: all), see get_client_profile
+
+        Returns:
+            Same dictionary as get_client_profile
 
-        return response
+        Raises:
+            ValueError: If fields contains an unknown column
+        """
+        start_ns = time.perf_counter_ns()
+        timestamp = datetime.now().isoformat()
+
+        fields = tuple(fields) if fields else _DEFAULT_COLUMNS
+        _build_profile_sql("client_id", fields)  # Validate fields up front
+
+        cache_key = self._profile_cache_key(client_id, postal_code, client_name, fields)
+        cached_response = self._cached_profile_response(cache_key, start_ns, timestamp)
+        if cached_response is not None:
+            return cached_response
+
+        fallback = None
+        if postal_code and client_name:
+            fallback = asyncio.create_task(
+                asyncio.to_thread(
+                    self._search_by_postal_code_and_name,
+                    postal_code,
+                    client_name,
+                    fields,
+                )
+            )
+
+        result = None
+        sql_query = None
+        search_method = "not_found"
+
+        if client_id:
+            sql_query, result = await asyncio.to_thread(
+                self._search_by_client_id, client_id, fields
+            )
+            if result:
+                search_method = "client_id"
+
+        if fallback is not None:
+            if result:
+                fallback.cancel()
+            else:
+                sql_query, result = await fallback
+                if result:
+                    search_method = "postal_code_and_name"
+
+        return self._profile_response(
+            sql_query, search_method, result, start_ns, timestamp, cache_key
+        )
 
     def run_analytical_query(
         self, question: str, authenticated_client_id: str
@@ -373,62 +1195,28 @@ class SQLRunner:
             - timestamp: Timestamp
             - privacy_compliant: Boolean indicating if query passed privacy rules
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         timestamp = datetime.now().isoformat()
+        client_id_lower = authenticated_client_id.lower()
 
         try:
-            # Get authenticated client's profile to provide context for "my city", "my state" queries
-            client_profile = self._execute_query(
-                f"SELECT client_city, client_state FROM customers WHERE client_id = '{authenticated_client_id}'"
-            )
+            sql_query = self._get_cached_sql(question, authenticated_client_id)
+            from_cache = sql_query is not None
+            if from_cache:
+                logger.info(f"Semantic cache hit, reusing SQL: {sql_query}")
+            else:
+                # Client context for "my city", "my state" queries; question goes last
+                session_context = self._session_context(authenticated_client_id)
+                sql_query = self._generate_sql(session_context, question).strip()
 
-            client_context = ""
-            if client_profile:
-                client_city = client_profile.get("client_city", "Unknown")
-                client_state = client_profile.get("client_state", "Unknown")
-                client_context = f"""
-                
-                AUTHENTICATED CLIENT CONTEXT:
-                - Client ID: {authenticated_client_id}
-                - City: {client_city}
-                - State: {client_state} (FULL NAME, not abbreviation)
-                
-                CRITICAL RULES FOR CITY QUERIES:
-                - When user asks about "my city" or references city data, ALWAYS filter by BOTH city AND state
-                - Use: WHERE client_city = '{client_city}' AND client_state = '{client_state}'
-                - NEVER filter by city alone (multiple cities can have same name in different states)
-                - State is stored as FULL NAME '{client_state}', NOT as abbreviation
-                """
-
-            # Generate SQL query using LLM
-            prompt_value = self.prompt.format(
-                schema=CUSTOMERS_SCHEMA,
-                question=f"""
-                Generate SQL for this question: {question}
-                {client_context}
-                
-                IMPORTANT PRIVACY RULES:
-                - The authenticated client is: {authenticated_client_id}
-                - ALLOW queries about this specific client's data
-                - ALLOW aggregate/statistical queries (COUNT, AVG, MAX, GROUP BY, etc.)
-                - BLOCK queries requesting individual data of OTHER specific clients
-                - Use GROUP BY, aggregation functions for statistical queries
-                """,
-            )
-            response = self.llm.invoke(prompt_value)
-            sql_query = response.content.strip()
+                # Clean SQL
+                sql_query = _FENCE_RE.sub("", sql_query).strip()
 
-            # Clean SQL
-            if sql_query.startswith("```sql"):
-                sql_query = sql_query.replace("```sql", "").replace("```", "").strip()
-            elif sql_query.startswith("```"):
-                sql_query = sql_query.replace("```", "").strip()
-
-            logger.info(f"Generated analytical SQL: {sql_query}")
+                logger.info(f"Generated analytical SQL: {sql_query}")
 
             # SECURITY CHECK: Validate read-only (block INSERT, UPDATE, DELETE, etc.)
-            is_valid, security_error = self._validate_read_only(sql_query)
-            if not is_valid:
+            tree, security_error = _parse_read_only(sql_query)
+            if tree is None:
                 logger.error(
                     f"Security violation in analytical query: {security_error}"
                 )
@@ -436,21 +1224,24 @@ class SQLRunner:
                     "sql_query": sql_query,
                     "result": None,
                     "query_type": "blocked",
-                    "execution_time_ms": (time.time() - start_time) * 1000,
+                    "execution_time_ms": _elapsed_ms(start_ns),
                     "timestamp": timestamp,
                     "privacy_compliant": False,
                     "error": security_error,
                 }
 
-            # Basic privacy check: detect queries trying to access other specific clients
-            sql_lower = sql_query.lower()
-            is_aggregate = any(
-                keyword in sql_lower
-                for keyword in ["count(", "avg(", "sum(", "max(", "min(", "group by"]
-            )
+            # Basic privacy check on the parsed query: detect queries trying to
+            # access other specific clients
+            is_aggregate = tree.find(exp.AggFunc, exp.Group) is not None
             references_other_client = (
-                "client_id" in sql_lower
-                and authenticated_client_id.lower() not in sql_lower
+                any(
+                    column.name.lower() == "client_id"
+                    for column in tree.find_all(exp.Column)
+                )
+                and not any(
+                    literal.is_string and literal.this.lower() == client_id_lower
+                    for literal in tree.find_all(exp.Literal)
+                )
                 and not is_aggregate
             )
 
@@ -462,35 +1253,55 @@ class SQLRunner:
                     "sql_query": sql_query,
                     "result": None,
                     "query_type": "blocked",
-                    "execution_time_ms": (time.time() - start_time) * 1000,
+                    "execution_time_ms": _elapsed_ms(start_ns),
                     "timestamp": timestamp,
                     "privacy_compliant": False,
                     "error": "PRIVACY_VIOLATION: Cannot access individual data of other clients",
                 }
 
-            # Execute query
-            import sqlite3
-
-            conn = sqlite3.connect(self.database_path)
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute(sql_query)
-            rows = cursor.fetchall()
-            conn.close()
-
-            # Convert to list of dicts
-            result = [dict(row) for row in rows]
+            # Execute query (or reuse the rows of an identical recent one).
+            # The key uses the parsed query re-rendered without comments, so
+            # formatting variations share an entry; the validated text runs as is
+            normalized_sql = tree.sql(comments=False)
+            result_key = hashlib.blake2b(
+                f"{authenticated_client_id}\0{normalized_sql}".encode(), digest_size=16
+            ).digest()
+            result = self._result_cache.get(result_key)
+            if result is None:
+                # Plain tuples zipped with the column names once per batch are
+                # cheaper than building a sqlite3.Row and converting it per row
+                cursor = self._conn.cursor()
+                cursor.row_factory = None
+                cursor.execute(sql_query)
+                columns = [description[0] for description in cursor.description]
+
+                # Convert to list of dicts
+                result = []
+                while True:
+                    batch = cursor.fetchmany(self.FETCH_BATCH_SIZE)
+                    if not batch:
+                        break
+                    result.extend(dict(zip(columns, row)) for row in batch)
+                cursor.close()
+                # Rows are cached and served as copies (their values are scalars)
+                self._result_cache.set(result_key, [dict(row) for row in result])
+            else:
+                logger.info("Analytical result cache hit")
+                result = [dict(row) for row in result]
 
             # Determine query type
             query_type = "aggregate" if is_aggregate else "individual_own"
 
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = _elapsed_ms(start_ns)
 
             logger.info(
                 f"Analytical query executed successfully: {len(result)} rows returned"
             )
 
+            # Only SQL that passed validation and ran is reused for similar questions
+            if not from_cache:
+                self._cache_sql(question, authenticated_client_id, sql_query)
+
             return {
                 "sql_query": sql_query,
                 "result": result,
@@ -506,19 +1317,46 @@ class SQLRunner:
                 "sql_query": None,
                 "result": None,
                 "query_type": "error",
-                "execution_time_ms": (time.time() - start_time) * 1000,
+                "execution_time_ms": _elapsed_ms(start_ns),
                 "timestamp": timestamp,
                 "privacy_compliant": False,
                 "error": str(e),
             }
 
 
+# Shared runners (one per database) so the connection and caches persist across tool calls
+_RUNNERS: Dict[str, SQLRunner] = {}
+_RUNNERS_LOCK = threading.Lock()
+
+
+def _get_runner(database_path: str) -> SQLRunner:
+    """
+    Return the process-wide SQLRunner for a database, creating it on first use.
+
+    Args:
+        database_path: Path to SQLite database file
+
+    Returns:
+        Shared SQLRunner instance
+    """
+    runner = _RUNNERS.get(database_path)
+    if runner is None:
+        with _RUNNERS_LOCK:
+            runner = _RUNNERS.get(database_path)
+            if runner is None:
+                runner = _RUNNERS[database_path] = SQLRunner(
+                    database_path=database_path
+                )
+    return runner
+
+
 # Convenience function for LangChain tool integration
 def get_client_profile(
     client_id: Optional[str] = None,
     postal_code: Optional[str] = None,
     client_name: Optional[str] = None,
     database_path: str = "data/customers.db",
+    fields: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
     """
     Retrieve client profile information from the database.
@@ -536,6 +1374,7 @@ def get_client_profile(
         postal_code: Postal code to search for (e.g., '92101') - used with client_name
         client_name: Client name to search for (e.g., 'Stone') - used with postal_code
         database_path: Path to SQLite database (default: 'customers.db')
+        fields: Columns to return (default: all), e.g. ['client_name', 'top5_beers_recently[0]']
 
     Returns:
         Dictionary with client profile data and metadata
@@ -550,9 +1389,11 @@ def get_client_profile(
         # Try client_id first, fallback to postal_code + name
         get_client_profile(client_id="CLT-XYZ", postal_code="92101", client_name="Stone")
     """
-    runner = SQLRunner(database_path=database_path)
-    return runner.get_client_profile(
-        client_id=client_id, postal_code=postal_code, client_name=client_name
+    return _get_runner(database_path).get_client_profile(
+        client_id=client_id,
+        postal_code=postal_code,
+        client_name=client_name,
+        fields=fields,
     )
 
 
@@ -596,7 +1437,6 @@ def run_analytical_query(
             authenticated_client_id="CLT-ABC123"
         )  # Returns privacy_compliant=False
     """
-    runner = SQLRunner(database_path=database_path)
-    return runner.run_analytical_query(
+    return _get_runner(database_path).run_analytical_query(
         question=question, authenticated_client_id=authenticated_client_id
     )
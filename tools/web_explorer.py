@@ -10,12 +10,14 @@ Features:
 - Precise search using brewery name + address + website
 - Gemini-based summarization (max 3 sentences)
 - Automatic cache updates
+- Concurrent batch summaries (get_website_summaries_batch)
 - Comprehensive error handling
 
 Architecture:
 - Step 1: Search RAG cache (FAISS)
 - Step 2: If cache hit → return cached summary
-- Step 3: If cache miss/stale → use Gemini Grounding
+- Step 2b: If cache stale → return stale summary, refresh in background
+- Step 3: If cache miss → use Gemini Grounding
 - Step 4: Save result to cache with TTL
 
 Benefits:
@@ -24,13 +26,17 @@ Benefits:
 - Grounding provides accurate, up-to-date information
 """
 
+import asyncio
 import logging
 import os
+import threading
 import time
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
 from dotenv import load_dotenv
+from google import genai
+from google.genai import types
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from utils.prompt_loader import load_prompt
@@ -41,6 +47,12 @@ load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# URL schemes validated without urlparse
+_HTTP_PREFIXES = ("http://", "https://")
+
+# Load Grounding prompt from external file
+WEB_EXPLORER_PROMPT = load_prompt("web_explorer.txt")
+
 
 class WebExplorer:
     """
@@ -62,6 +74,7 @@ class WebExplorer:
         ttl_days: int = 30,
         gemini_model: str = "gemini-2.5-flash",
         temperature: float = 0,
+        stale_while_revalidate: bool = True,
     ):
         """
         Initialize Web Explorer.
@@ -71,6 +84,8 @@ class WebExplorer:
             ttl_days: Cache TTL in days
             gemini_model: Gemini model for summarization
             temperature: LLM temperature (0 for deterministic)
+            stale_while_revalidate: Serve stale cache entries immediately and
+                refresh them in a background thread (False: block on Grounding)
         """
         # Validate Google API Key
         api_key = os.getenv("GOOGLE_API_KEY")
@@ -86,6 +101,14 @@ class WebExplorer:
             logger.error(f"Failed to initialize RAG Manager: {e}")
             raise
 
+        # FAISS index/docstore are not safe for concurrent writes (batch mode)
+        self._cache_lock = threading.Lock()
+
+        # Stale-while-revalidate: breweries with a background refresh in flight
+        self.stale_while_revalidate = stale_while_revalidate
+        self._refreshing = set()
+        self._refreshing_lock = threading.Lock()
+
         # Initialize Gemini for summarization
         try:
             self.llm = ChatGoogleGenerativeAI(
@@ -96,16 +119,58 @@ class WebExplorer:
             logger.error(f"Failed to initialize Gemini: {e}")
             raise
 
-    def _is_valid_url(self, url: str) -> bool:
+        # Grounding client and config are reused so HTTP connections stay warm
+        # Reference: https://ai.google.dev/gemini-api/docs/google-search
+        self._gemini_model = gemini_model
+        self._genai_client = genai.Client(api_key=api_key)
+        self._grounding_config = types.GenerateContentConfig(
+            tools=[types.Tool(google_search=types.GoogleSearch())],
+            temperature=0,  # Deterministic output
+        )
+
+    def close(self) -> None:
+        """
+        Write pending cache updates to disk and stop the cache's threads.
+
+        Only the owner of the explorer should call this: the explorer cannot
+        schedule cache updates afterwards. The shared explorer used by the
+        module functions is never closed; its changes are written by the
+        cache's debounced flush and at interpreter exit.
+        """
+        lock = getattr(self, "_cache_lock", None)
+        if lock is None:
+            return
+        with lock:
+            self.rag_manager.close()
+
+    def __enter__(self) -> "WebExplorer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    @staticmethod
+    def _is_valid_url(url: str) -> bool:
         """
         Validate URL format.
 
+        Plain http(s)://host URLs are checked with string operations; anything
+        else (other schemes, IPv6 hosts) goes through urlparse.
+
         Args:
             url: URL to validate
 
         Returns:
             True if valid, False otherwise
         """
+        if not url:
+            return False
+        if url.startswith(_HTTP_PREFIXES) and "[" not in url:
+            host_start = url.index("//") + 2
+            return len(url) > host_start and url[host_start] not in "/?#"
         try:
             result = urlparse(url)
             return all([result.scheme, result.netloc])
@@ -134,31 +199,16 @@ class WebExplorer:
                 f"Using Gemini Grounding for: {brewery_name} | {address} | {url}"
             )
 
-            # Load prompt template from external file
-            prompt_template = load_prompt("web_explorer.txt")
             # Replace variables in template
-            prompt = prompt_template.format(
+            prompt = WEB_EXPLORER_PROMPT.format(
                 brewery_name=brewery_name, address=address, url=url
             )
 
-            # Use the new Google GenAI SDK with google_search tool
-            # Reference: https://ai.google.dev/gemini-api/docs/google-search
-            from google import genai
-            from google.genai import types
-
-            # Initialize client
-            client = genai.Client(api_key=os.getenv("GOOGLE_API_KEY"))
-
-            # Configure grounding tool
-            grounding_tool = types.Tool(google_search=types.GoogleSearch())
-
-            config = types.GenerateContentConfig(
-                tools=[grounding_tool], temperature=0  # Deterministic output
-            )
-
             # Generate content with grounding
-            response = client.models.generate_content(
-                model="gemini-2.5-flash", contents=prompt, config=config
+            response = self._genai_client.models.generate_content(
+                model=self._gemini_model,
+                contents=prompt,
+                config=self._grounding_config,
             )
 
             summary = response.text.strip()
@@ -180,6 +230,92 @@ class WebExplorer:
             logger.error(f"Failed to generate grounded summary: {e}")
             return None
 
+    def _refresh_cache(
+        self,
+        brewery_name: str,
+        url: str,
+        brewery_type: str,
+        address: str,
+        store_in_background: bool = True,
+    ) -> Optional[str]:
+        """
+        Generate a fresh grounded summary and store it in the cache.
+
+        Args:
+            brewery_name: Name of the brewery
+            url: Website URL
+            brewery_type: Type of brewery
+            address: Address of the brewery
+            store_in_background: Return without waiting for the cache write;
+                False when already running as a background task
+
+        Returns:
+            New summary or None if Grounding failed
+        """
+        summary = self._grounded_search_summary(
+            brewery_name=brewery_name, address=address, url=url
+        )
+        if not summary:
+            return None
+
+        def log_update(updated: bool) -> None:
+            if updated:
+                logger.info(f"Cache updated for {brewery_name}")
+            else:
+                logger.warning(f"Failed to update cache for {brewery_name}")
+
+        if not store_in_background:
+            log_update(
+                self.rag_manager.update_cache_entry(
+                    brewery_name, url, summary, brewery_type
+                )
+            )
+            return summary
+
+        # Stored in the background, so the summary is returned without waiting
+        # for its embedding request; close() and the exit flush wait for it
+        self.rag_manager.submit_to_cache(
+            brewery_name=brewery_name,
+            url=url,
+            summary=summary,
+            brewery_type=brewery_type,
+            replace=True,
+        ).add_done_callback(lambda stored: log_update(stored.result()))
+        return summary
+
+    def _schedule_refresh(
+        self, brewery_name: str, url: str, brewery_type: str, address: str
+    ) -> None:
+        """
+        Refresh a stale cache entry in the background (at most one per brewery).
+
+        The refresh runs as a cache manager task, so close() and the exit
+        flush wait for it and the new summary is saved even when the caller
+        finishes first.
+
+        Args:
+            brewery_name: Name of the brewery
+            url: Website URL
+            brewery_type: Type of brewery
+            address: Address of the brewery
+        """
+        key = brewery_name.lower()
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._refresh_cache(
+                    brewery_name, url, brewery_type, address, store_in_background=False
+                )
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+
+        self.rag_manager.submit_task(refresh)
+
     def get_website_summary(
         self,
         brewery_name: str,
@@ -194,6 +330,7 @@ class WebExplorer:
             brewery_name: Name of the brewery
             url: Website URL
             brewery_type: Type of brewery (micro, brewpub, etc.)
+            address: Address of the brewery (optional)
 
         Returns:
             Dictionary with summary and metadata:
@@ -201,13 +338,37 @@ class WebExplorer:
                 "brewery_name": str,
                 "url": str,
                 "summary": str,
-                "source": "cache_hit|cache_stale|web_search",
+                "source": "cache_hit|cache_stale_served|web_search",
                 "cache_status": "CACHE_HIT|CACHE_STALE|CACHE_MISS",
                 "brewery_type": str,
                 "execution_time_ms": float,
                 "error": str (optional)
             }
         """
+        return self._summarize(brewery_name, url, brewery_type, address)
+
+    def _summarize(
+        self,
+        brewery_name: str,
+        url: str,
+        brewery_type: str = "unknown",
+        address: str = "",
+        cache_lookup: Optional[Tuple[Optional[Dict], str]] = None,
+    ) -> Dict:
+        """
+        Implementation of get_website_summary.
+
+        Args:
+            brewery_name: Name of the brewery
+            url: Website URL
+            brewery_type: Type of brewery
+            address: Address of the brewery
+            cache_lookup: (cached_result, cache_status) from a batched cache
+                search; searched here when None
+
+        Returns:
+            Same dictionary as get_website_summary
+        """
         start_time = time.time()
         # Validate URL
         if not url or not self._is_valid_url(url):
@@ -223,63 +384,127 @@ class WebExplorer:
                 "error": "INVALID_URL",
             }
         # Step 1: Search cache
-        cached_result, cache_status = self.rag_manager.search_cache(
-            query=brewery_name, brewery_name=brewery_name
-        )
+        if cache_lookup is None:
+            with self._cache_lock:
+                cache_lookup = self.rag_manager.search_cache(
+                    query=brewery_name, brewery_name=brewery_name
+                )
+        cached_result, cache_status = cache_lookup
+        error = None
         # Step 2: Handle cache hit (valid data)
         if cache_status == "CACHE_HIT" and cached_result:
             logger.info(f"Cache hit for {brewery_name}")
-            return {
-                "brewery_name": brewery_name,
-                "url": url,
-                "summary": cached_result["summary"],
-                "source": "cache_hit",
-                "cache_status": cache_status,
-                "brewery_type": brewery_type,
-                "execution_time_ms": (time.time() - start_time) * 1000,
-            }
+            summary, source = cached_result["summary"], "cache_hit"
+        # Step 2b: Serve stale data now, refresh it off the request path
+        elif (
+            cache_status == "CACHE_STALE"
+            and cached_result
+            and self.stale_while_revalidate
+        ):
+            logger.info(f"Serving stale cache for {brewery_name}, refreshing")
+            self._schedule_refresh(brewery_name, url, brewery_type, address)
+            summary, source = cached_result["summary"], "cache_stale_served"
         # Step 3: Handle cache miss or stale - use Gemini Grounding
-        logger.info(
-            f"Cache {cache_status.lower()} for {brewery_name}, using Gemini Grounding fallback"
-        )
-        summary = self._grounded_search_summary(
-            brewery_name=brewery_name, address=address, url=url
-        )
-        if not summary:
-            error_msg = f"Não foi possível gerar resumo para {brewery_name} via Gemini Grounding"
-            logger.error(error_msg)
-            return {
-                "brewery_name": brewery_name,
-                "url": url,
-                "summary": error_msg,
-                "source": "web_search",
-                "cache_status": cache_status,
-                "brewery_type": brewery_type,
-                "execution_time_ms": (time.time() - start_time) * 1000,
-                "error": "GROUNDING_FAILED",
-            }
-        # Step 4: Update cache
-        if cache_status in ["CACHE_MISS", "CACHE_STALE"]:
-            cache_updated = self.rag_manager.add_to_cache(
-                brewery_name=brewery_name,
-                url=url,
-                summary=summary,
-                brewery_type=brewery_type,
+        else:
+            logger.info(
+                f"Cache {cache_status.lower()} for {brewery_name}, using Gemini Grounding fallback"
             )
-            if cache_updated:
-                self.rag_manager.save_index()
-                logger.info(f"Cache updated and saved for {brewery_name}")
-            else:
-                logger.warning(f"Failed to update cache for {brewery_name}")
-        return {
+            # Step 4: Update cache (done by _refresh_cache)
+            summary = self._refresh_cache(brewery_name, url, brewery_type, address)
+            source = "web_search"
+            if not summary:
+                summary = f"Não foi possível gerar resumo para {brewery_name} via Gemini Grounding"
+                logger.error(summary)
+                error = "GROUNDING_FAILED"
+
+        result = {
             "brewery_name": brewery_name,
             "url": url,
             "summary": summary,
-            "source": "web_search",
+            "source": source,
             "cache_status": cache_status,
             "brewery_type": brewery_type,
             "execution_time_ms": (time.time() - start_time) * 1000,
         }
+        if error:
+            result["error"] = error
+        return result
+
+    async def get_website_summaries_batch(
+        self, items: List[Dict[str, Any]], max_concurrency: int = 8
+    ) -> List[Dict]:
+        """
+        Get summaries for several breweries concurrently.
+
+        The cache is searched for all breweries with one batched embedding and
+        FAISS call. Each item then runs in a worker thread, so N Gemini Grounding
+        calls take about as long as the slowest one instead of the sum.
+
+        Args:
+            items: List of keyword-argument dicts for get_website_summary
+                (brewery_name, url and optionally brewery_type, address)
+            max_concurrency: Maximum number of summaries in flight at once (rate limit)
+
+        Returns:
+            List of summary dictionaries, in the same order as items
+        """
+        # Step 1 for every item with a valid URL, in one batched search
+        valid = [
+            i
+            for i, item in enumerate(items)
+            if item.get("url") and self._is_valid_url(item["url"])
+        ]
+        names = [items[i]["brewery_name"] for i in valid]
+        lookups = dict(
+            zip(valid, await asyncio.to_thread(self._search_cache_batch, names))
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def summarize(index: int, item: Dict[str, Any]) -> Dict:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self._summarize, cache_lookup=lookups.get(index), **item
+                )
+
+        results = await asyncio.gather(
+            *(summarize(i, item) for i, item in enumerate(items))
+        )
+        # Debounced: writes only once enough changes are pending, without
+        # waiting for the background stores and refreshes still running
+        await asyncio.to_thread(self.rag_manager.flush)
+        return results
+
+    def _search_cache_batch(
+        self, brewery_names: List[str]
+    ) -> List[Tuple[Optional[Dict], str]]:
+        """Search the cache for several breweries (by name) under the cache lock."""
+        with self._cache_lock:
+            return self.rag_manager.search_cache_batch(
+                queries=brewery_names, brewery_names=brewery_names
+            )
+
+
+# Shared explorer so the Gemini clients and the loaded FAISS cache persist across
+# tool calls; it is never closed, so background refreshes and stores outlive
+# the call that scheduled them
+_DEFAULT_EXPLORER: Optional[WebExplorer] = None
+_DEFAULT_EXPLORER_LOCK = threading.Lock()
+
+
+def _get_explorer() -> WebExplorer:
+    """
+    Return the process-wide WebExplorer, creating it on first use.
+
+    Returns:
+        Shared WebExplorer instance
+    """
+    global _DEFAULT_EXPLORER
+    if _DEFAULT_EXPLORER is None:
+        with _DEFAULT_EXPLORER_LOCK:
+            if _DEFAULT_EXPLORER is None:
+                _DEFAULT_EXPLORER = WebExplorer()
+    return _DEFAULT_EXPLORER
 
 
 # Convenience function for direct use
@@ -296,5 +521,26 @@ def get_website_summary(
     Returns:
         Dictionary with summary and metadata
     """
-    explorer = WebExplorer()
-    return explorer.get_website_summary(brewery_name, url, brewery_type, address)
+    return _get_explorer().get_website_summary(brewery_name, url, brewery_type, address)
+
+
+def get_website_summaries_batch(
+    items: List[Dict[str, Any]], max_concurrency: int = 8
+) -> List[Dict]:
+    """
+    Convenience function to get several website summaries concurrently.
+
+    Must be called from synchronous code (it starts its own event loop);
+    async callers should await WebExplorer.get_website_summaries_batch directly.
+
+    Args:
+        items: List of keyword-argument dicts for get_website_summary
+        max_concurrency: Maximum number of summaries in flight at once
+    Returns:
+        List of summary dictionaries, in the same order as items
+    """
+    return asyncio.run(
+        _get_explorer().get_website_summaries_batch(
+            items, max_concurrency=max_concurrency
+        )
+    )
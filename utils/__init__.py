@@ -4,5 +4,7 @@ Contains utility functions and helpers
 """
 
 from .prompt_loader import load_prompt
+from .semantic_cache import SemanticCache
+from .ttl_cache import TTLCache
 
-__all__ = ["load_prompt"]
+__all__ = ["load_prompt", "SemanticCache", "TTLCache"]
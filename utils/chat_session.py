@@ -10,7 +10,7 @@ from datetime import datetime
 from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a single message in the conversation."""
 
@@ -42,6 +42,11 @@ class ChatSession:
         self.messages: List[Message] = []
         self.created_at = datetime.now()
         self.metadata: Dict = {}
+        # Per-role message counts, kept up to date by add_message for get_stats
+        self._user_count = 0
+        self._assistant_count = 0
+        # Agent-formatted history, appended alongside self.messages
+        self._agent_context: List[Dict] = []
 
     def add_message(self, role: str, content: str) -> Message:
         """
@@ -56,6 +61,11 @@ class ChatSession:
         """
         message = Message(role=role, content=content)
         self.messages.append(message)
+        self._agent_context.append({"role": role, "content": content})
+        if role == "user":
+            self._user_count += 1
+        elif role == "assistant":
+            self._assistant_count += 1
         return message
 
     def get_history(self, limit: Optional[int] = None) -> List[Message]:
@@ -75,15 +85,27 @@ class ChatSession:
     def clear_history(self):
         """Clear all messages from the session."""
         self.messages.clear()
+        self._user_count = 0
+        self._assistant_count = 0
+        self._agent_context.clear()
 
-    def get_context_for_agent(self) -> List[Dict]:
+    def get_context_for_agent(self, limit: Optional[int] = None) -> List[Dict]:
         """
         Get conversation history formatted for the agent.
 
+        The message dicts are built incrementally by add_message, so this does
+        not re-create one dict per message on every agent turn. The returned
+        list is a copy, but the dicts are shared: treat them as read-only.
+
+        Args:
+            limit: Maximum number of messages to return (most recent)
+
         Returns:
             List of message dictionaries for LangChain
         """
-        return [{"role": msg.role, "content": msg.content} for msg in self.messages]
+        if limit is not None:
+            return self._agent_context[-limit:] if limit > 0 else []
+        return list(self._agent_context)
 
     def set_client_id(self, client_id: str):
         """Set the client ID for this session."""
@@ -96,9 +118,6 @@ class ChatSession:
         Returns:
             Dictionary with session stats
         """
-        user_messages = sum(1 for m in self.messages if m.role == "user")
-        assistant_messages = sum(1 for m in self.messages if m.role == "assistant")
-
         duration = datetime.now() - self.created_at
 
         return {
@@ -106,7 +125,7 @@ class ChatSession:
             "client_id": self.client_id,
             "duration_seconds": duration.total_seconds(),
             "total_messages": len(self.messages),
-            "user_messages": user_messages,
-            "assistant_messages": assistant_messages,
+            "user_messages": self._user_count,
+            "assistant_messages": self._assistant_count,
             "created_at": self.created_at.isoformat(),
         }
@@ -6,16 +6,21 @@ keeping prompts separate from code for better maintainability.
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
 def load_prompt(filename: str, prompts_dir: Optional[Path] = None) -> str:
     """
     Load prompt content from a file in the prompts/ directory.
 
+    Results are memoized per (filename, prompts_dir), so each file is read from
+    disk once per process. Edits to a prompt file need a restart to take effect.
+
     Args:
         filename: Name of the file to load (e.g., 'sql_generation.txt')
         prompts_dir: Optional custom path to prompts directory.
@@ -6,24 +6,68 @@ with metadata including creation dates for TTL validation (30 days).
 
 Features:
 - Google Embeddings (models/embedding-001)
-- FAISS vector store for semantic search
+- FAISS vector store for semantic search (HNSW graph index, sub-linear search)
+- float16 vector storage (half the memory and index file size of float32)
 - TTL validation (30 days)
-- Persistence to disk
+- Persistence to disk (debounced: see flush)
+- Micro-batching of concurrent async lookups (BatchingSearcher)
 - Metadata management (brewery_name, url, summary, creation_date, brewery_type)
 """
 
+import asyncio
+import atexit
 import logging
 import os
+import pickle
+import re
+import threading
+import time
+import uuid
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
+import faiss
+import numpy as np
 from langchain.docstore.document import Document
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import Embeddings
 from langchain_google_genai import GoogleGenerativeAIEmbeddings
 
+from .ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+_NON_WORD_RE = re.compile(r"\W+")
+
+
+def _name_key(name: str) -> str:
+    """Normalize a brewery name for lookups: lowercase, no spaces or punctuation."""
+    return _NON_WORD_RE.sub("", name.lower())
+
+
+@contextmanager
+def _omp_threads(n: int) -> Iterator[None]:
+    """
+    Limit FAISS to n OpenMP threads in the calling thread, then restore.
+
+    A single-query search is too small to split across threads; spinning the
+    OpenMP pool up for it costs more than the search itself, and competes
+    with any BLAS threads. The setting is per thread, so concurrent batch
+    searches in other threads keep the default.
+    """
+    previous = faiss.omp_get_max_threads()
+    faiss.omp_set_num_threads(n)
+    try:
+        yield
+    finally:
+        faiss.omp_set_num_threads(previous)
+
 
 class RAGManager:
     """
@@ -33,11 +77,32 @@ class RAGManager:
     repeated web searches within a 30-day window.
     """
 
+    # HNSW graph parameters for new indexes: neighbours per node, build-time and
+    # search-time candidate list sizes (efSearch trades speed for recall)
+    HNSW_M = 32
+    HNSW_EF_CONSTRUCTION = 200
+    HNSW_EF_SEARCH = 64
+    # Caches above this size are compressed to IVF+PQ when loaded: PQ_M bytes per
+    # vector instead of 4 * dim, searching nprobe of up to IVF_NLIST clusters
+    IVFPQ_MIN_DOCS = 2000
+    IVF_NLIST = 256
+    PQ_M = 32
+    # Without force, flush() writes once FLUSH_MAX_PENDING changes are unsaved or
+    # the last write is FLUSH_INTERVAL seconds old; the rest is written at exit
+    FLUSH_MAX_PENDING = 20
+    FLUSH_INTERVAL = 60.0
+    # Query vectors of recently searched names, so repeats skip the embeddings API
+    QUERY_VECTOR_CACHE_SIZE = 4096
+    QUERY_VECTOR_CACHE_TTL = 24 * 3600
+    # Background threads for submit_to_cache (embedding requests run in parallel)
+    ADD_WORKERS = 4
+
     def __init__(
         self,
         index_path: str = "data/faiss_index",
         ttl_days: int = 30,
         embedding_model: str = "models/embedding-001",
+        nprobe: int = 16,
     ):
         """
         Initialize RAG Manager.
@@ -46,25 +111,60 @@ class RAGManager:
             index_path: Path to save/load FAISS index
             ttl_days: Time-to-live for cached entries (default: 30 days)
             embedding_model: Google embedding model name
+            nprobe: IVF clusters searched per query once the index is compressed
+                (higher: better recall, slower search)
         """
         self.index_path = Path(index_path)
         self.ttl_days = ttl_days
         self.embedding_model = embedding_model
+        self.nprobe = nprobe
 
         # Create directory if it doesn't exist
         self.index_path.mkdir(parents=True, exist_ok=True)
+        # Paths as strings, built once (the layout written by FAISS.save_local)
+        self._index_dir = str(self.index_path)
+        self._index_file = os.path.join(self._index_dir, "index.faiss")
+        self._docstore_file = os.path.join(self._index_dir, "index.pkl")
+
+        # Number of changes not yet written to disk (see flush)
+        self._dirty = 0
+        self._last_flush = time.monotonic()
+        self._flush_lock = threading.Lock()
+        _OPEN_MANAGERS.add(self)
+
+        # Guards the index, docstore and id maps against concurrent changes
+        self._index_lock = threading.RLock()
+        # Tasks queued by submit_task/submit_to_cache; flush(force=True) waits
+        # for them. The set is shared with the pool threads, hence its lock
+        self._add_pool = ThreadPoolExecutor(
+            max_workers=self.ADD_WORKERS, thread_name_prefix="rag-add"
+        )
+        self._pending_tasks: Set[Future] = set()
+        self._pending_lock = threading.Lock()
+
+        # Load or create FAISS index
+        self._index_mapped = False
+        self.vectorstore = self._load_or_create_index()
+
+        # FAISS ids of the documents cached under each brewery name (see _name_key)
+        self._name_ids = self._build_name_index()
 
-        # Initialize embeddings
+        # Keyed on the normalized query text (see _embed_queries)
+        self._query_vectors = TTLCache(
+            maxsize=self.QUERY_VECTOR_CACHE_SIZE, ttl=self.QUERY_VECTOR_CACHE_TTL
+        )
+
+    @cached_property
+    def embeddings(self) -> GoogleGenerativeAIEmbeddings:
+        """Google embeddings client, created on first use."""
         try:
-            self.embeddings = GoogleGenerativeAIEmbeddings(model=embedding_model)
-            logger.info(f"Initialized Google Embeddings: {embedding_model}")
+            embeddings = GoogleGenerativeAIEmbeddings(model=self.embedding_model)
+            logger.info(f"Initialized Google Embeddings: {self.embedding_model}")
+            return embeddings
         except Exception as e:
             logger.error(f"Failed to initialize embeddings: {e}")
             raise
 
-        # Load or create FAISS index
-        self.vectorstore = self._load_or_create_index()
-
     def _load_or_create_index(self) -> FAISS:
         """
         Load existing FAISS index from disk or create a new one.
@@ -72,43 +172,201 @@ class RAGManager:
         Returns:
             FAISS vectorstore instance
         """
-        index_file = self.index_path / "index.faiss"
-
-        if index_file.exists():
+        if os.path.exists(self._index_file):
             try:
-                vectorstore = FAISS.load_local(
-                    str(self.index_path),
-                    self.embeddings,
-                    allow_dangerous_deserialization=True,
+                index = self._read_index(self._index_file)
+                with open(self._docstore_file, "rb") as f:
+                    docstore, index_to_docstore_id = pickle.load(f)
+                vectorstore = FAISS(
+                    embedding_function=_DeferredEmbeddings(self),
+                    index=index,
+                    docstore=docstore,
+                    index_to_docstore_id=index_to_docstore_id,
                 )
-                logger.info(f"Loaded existing FAISS index from {self.index_path}")
+                if isinstance(vectorstore.index, faiss.IndexHNSW):
+                    vectorstore.index.hnsw.efSearch = self.HNSW_EF_SEARCH
+                if isinstance(vectorstore.index, faiss.IndexFlat):
+                    # Legacy float32 flat index: store it as float16 from now on
+                    vectorstore.index = self._to_fp16(vectorstore.index)
+                    self.mark_dirty()
+                if self._should_compress(vectorstore.index):
+                    vectorstore.index = self._compress_index(vectorstore.index)
+                    self.mark_dirty()
+                if isinstance(vectorstore.index, faiss.IndexIVF):
+                    vectorstore.index.nprobe = self.nprobe
+                    # Needed to reconstruct vectors for name-filtered searches
+                    vectorstore.index.make_direct_map()
+                logger.info(f"Loaded existing FAISS index from {self._index_dir}")
                 return vectorstore
             except Exception as e:
                 logger.warning(f"Failed to load index, creating new one: {e}")
 
-        # Create empty index with a dummy document
-        dummy_doc = Document(
-            page_content="initialization",
-            metadata={"type": "system", "creation_date": datetime.now().isoformat()},
+        # Create an empty index; one embedding call tells the vector dimension
+        dim = len(self.embeddings.embed_query("dimension probe"))
+        vectorstore = FAISS(
+            embedding_function=self.embeddings,
+            index=self._new_index(dim),
+            docstore=InMemoryDocstore(),
+            index_to_docstore_id={},
         )
-        vectorstore = FAISS.from_documents([dummy_doc], self.embeddings)
         logger.info("Created new FAISS index")
 
         return vectorstore
 
-    def _is_cache_valid(self, creation_date_str: str) -> bool:
+    def _read_index(self, index_file: str) -> faiss.Index:
+        """
+        Read an index file, memory-mapping the inverted lists of IVF indexes.
+
+        Mapped lists are paged in by the OS as clusters are probed instead of
+        being read up front, so a large compressed cache loads immediately and
+        only its probed part occupies RAM. They are read-only: _writable_index
+        reads them into memory before the first change.
+
+        Args:
+            index_file: Path to the .faiss file
+
+        Returns:
+            FAISS index
+        """
+        try:
+            index = faiss.read_index(
+                index_file, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        except RuntimeError as e:
+            logger.warning(f"Could not memory-map {index_file}, reading it: {e}")
+            return faiss.read_index(index_file)
+        # Other index types ignore the flags and are read into memory
+        self._index_mapped = isinstance(index, faiss.IndexIVF)
+        return index
+
+    def _writable_index(self) -> faiss.Index:
+        """
+        Return the index, reading memory-mapped inverted lists into RAM first.
+
+        Returns:
+            FAISS index that supports adds and can be saved over its own file
+        """
+        if self._index_mapped:
+            index = faiss.read_index(self._index_file)
+            index.nprobe = self.nprobe
+            index.make_direct_map()
+            self.vectorstore.index = index
+            self._index_mapped = False
+        return self.vectorstore.index
+
+    def _build_name_index(self) -> Dict[str, List[int]]:
+        """
+        Map each normalized brewery name to the FAISS ids of its documents.
+
+        Returns:
+            Dictionary of brewery name -> FAISS ids
+        """
+        name_ids: Dict[str, List[int]] = {}
+        docstore = self.vectorstore.docstore
+        for faiss_id, doc_id in self.vectorstore.index_to_docstore_id.items():
+            doc = docstore.search(doc_id)
+            name = (
+                doc.metadata.get("brewery_name") if isinstance(doc, Document) else None
+            )
+            if name:
+                name_ids.setdefault(_name_key(name), []).append(faiss_id)
+        return name_ids
+
+    def _new_index(self, dim: int) -> faiss.Index:
+        """
+        Create an empty HNSW index for vectors of the given dimension.
+
+        HNSW finds neighbours in roughly logarithmic time instead of scanning
+        every cached vector like the default flat index. Vectors are stored as
+        float16, which halves memory and file size; the rounding error (~1e-3
+        relative) is far below the distance gaps between different breweries,
+        so recall is practically unchanged.
+
+        Args:
+            dim: Embedding dimension
+
+        Returns:
+            Empty FAISS index (L2 distance, as LangChain's FAISS store expects)
+        """
+        index = faiss.IndexHNSWSQ(dim, faiss.ScalarQuantizer.QT_fp16, self.HNSW_M)
+        index.hnsw.efConstruction = self.HNSW_EF_CONSTRUCTION
+        index.hnsw.efSearch = self.HNSW_EF_SEARCH
+        return index
+
+    @staticmethod
+    def _to_fp16(index: faiss.IndexFlat) -> faiss.IndexScalarQuantizer:
+        """
+        Copy a float32 flat index into a float16 scalar-quantized flat index.
+
+        Vectors keep their order, so index_to_docstore_id stays valid.
+
+        Args:
+            index: Flat L2 index to convert
+
+        Returns:
+            Equivalent exhaustive-search index storing float16 vectors
+        """
+        converted = faiss.IndexScalarQuantizer(
+            index.d, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_L2
+        )
+        converted.add(index.reconstruct_n(0, index.ntotal))
+        return converted
+
+    def _should_compress(self, index: faiss.Index) -> bool:
+        """Whether a loaded index is large enough, and not yet, IVF+PQ compressed."""
+        return (
+            index.ntotal > self.IVFPQ_MIN_DOCS
+            and not isinstance(index, faiss.IndexIVF)
+            and index.d % self.PQ_M == 0
+        )
+
+    def _compress_index(self, index: faiss.Index) -> faiss.IndexIVFPQ:
+        """
+        Rebuild an index as IVF+PQ, trained on its own vectors.
+
+        Vectors are re-added in their original order, so the store's
+        index_to_docstore_id mapping stays valid.
+
+        Args:
+            index: Populated index whose vectors can be reconstructed
+
+        Returns:
+            Trained and populated IVF+PQ index
+        """
+        vectors = index.reconstruct_n(0, index.ntotal)
+        # About 4 * sqrt(N) clusters keeps enough training points per centroid
+        nlist = min(self.IVF_NLIST, int(4 * np.sqrt(index.ntotal)))
+        quantizer = faiss.IndexFlatL2(index.d)
+        compressed = faiss.IndexIVFPQ(quantizer, index.d, nlist, self.PQ_M, 8)
+        compressed.train(vectors)
+        compressed.add(vectors)
+        logger.info(
+            f"Compressed FAISS index to IVF{nlist},PQ{self.PQ_M} "
+            f"({index.ntotal} vectors)"
+        )
+        return compressed
+
+    def _is_cache_valid(
+        self, creation_date_str: str, creation_ts: Optional[int] = None
+    ) -> bool:
         """
         Check if cached entry is still valid based on TTL.
 
         Args:
             creation_date_str: ISO format date string
+            creation_ts: Creation time in epoch seconds; used instead of
+                parsing creation_date_str when present (entries cached before
+                it was stored only have the date string)
 
         Returns:
             True if cache is valid (< ttl_days old), False otherwise
         """
         try:
-            creation_date = datetime.fromisoformat(creation_date_str)
-            age_days = (datetime.now() - creation_date).days
+            if creation_ts is not None:
+                age_days = (int(time.time()) - creation_ts) // 86400
+            else:
+                creation_date = datetime.fromisoformat(creation_date_str)
+                age_days = (datetime.now() - creation_date).days
             is_valid = age_days <= self.ttl_days
 
             logger.debug(
@@ -121,12 +379,62 @@ class RAGManager:
             logger.error(f"Invalid creation_date format: {creation_date_str}, {e}")
             return False
 
+    def _bulk_validity(
+        self,
+        creation_dates: List[Optional[str]],
+        creation_ts: Optional[List[Optional[int]]] = None,
+    ) -> np.ndarray:
+        """
+        Vectorized _is_cache_valid over many creation dates.
+
+        Args:
+            creation_dates: ISO format date strings (None when missing)
+            creation_ts: Creation times in epoch seconds (None when missing),
+                preferred over the date strings where present
+
+        Returns:
+            Boolean array, True where the entry is valid; missing or malformed
+            dates are invalid
+        """
+        if creation_ts is not None:
+            ts = np.array([-1 if t is None else t for t in creation_ts], dtype=np.int64)
+            has_ts = ts >= 0
+            valid = np.empty(len(ts), dtype=bool)
+            valid[has_ts] = (int(time.time()) - ts[has_ts]) // 86400 <= self.ttl_days
+            if not has_ts.all():
+                valid[~has_ts] = self._bulk_validity(
+                    [creation_dates[i] for i in np.flatnonzero(~has_ts)]
+                )
+            return valid
+
+        try:
+            dates = np.array(
+                [date or "NaT" for date in creation_dates], dtype="datetime64[us]"
+            )
+        except ValueError:
+            # Some date numpy cannot parse: fall back to the scalar check
+            return np.fromiter(
+                (bool(date) and self._is_cache_valid(date) for date in creation_dates),
+                dtype=bool,
+                count=len(creation_dates),
+            )
+
+        # Whole days of age, floored like timedelta.days
+        now = np.datetime64(datetime.now(), "us")
+        with np.errstate(invalid="ignore"):
+            age_days = (now - dates) // np.timedelta64(1, "D")
+        return ~np.isnat(dates) & (age_days <= self.ttl_days)
+
     def search_cache(
         self, query: str, top_k: int = 1, brewery_name: Optional[str] = None
     ) -> Tuple[Optional[Dict], str]:
         """
         Search cache for existing brewery summary.
 
+        With brewery_name, only entries cached under that name (ignoring case,
+        spaces and punctuation) are considered, and a name with no entries is a
+        miss without any embedding call or vector search.
+
         Args:
             query: Search query (brewery name or URL)
             top_k: Number of results to retrieve
@@ -137,46 +445,228 @@ class RAGManager:
             - result_dict: None or dict with brewery info
             - status: "CACHE_HIT", "CACHE_STALE", or "CACHE_MISS"
         """
+        ids = self._candidate_ids(brewery_name)
+        if ids == []:
+            logger.info(f"Cache miss for brewery: {brewery_name}")
+            return None, "CACHE_MISS"
+
         try:
             # Perform similarity search
-            docs = self.vectorstore.similarity_search(query, k=top_k)
-
-            if not docs or docs[0].metadata.get("type") == "system":
-                logger.info(f"Cache miss for query: {query}")
-                return None, "CACHE_MISS"
-
-            # Get the top result
-            top_doc = docs[0]
-            metadata = top_doc.metadata
-
-            # Validate brewery name if provided
-            if brewery_name:
-                cached_name = metadata.get("brewery_name", "").lower()
-                if brewery_name.lower() not in cached_name:
-                    logger.info(
-                        f"Brewery name mismatch: {brewery_name} vs {cached_name}"
+            vector = self._embed_queries([query])[0]
+            with self._index_lock:
+                # Looked up again: a concurrent save may have renumbered the ids
+                docs = self._nearest_docs(
+                    vector, self._candidate_ids(brewery_name), top_k
+                )
+                return self._cache_result(docs, query)
+        except Exception as e:
+            logger.error(f"Cache search failed: {e}")
+            return None, "CACHE_MISS"
+
+    def search_cache_batch(
+        self,
+        queries: List[str],
+        brewery_names: Optional[List[Optional[str]]] = None,
+        top_k: int = 1,
+    ) -> List[Tuple[Optional[Dict], str]]:
+        """
+        Search cache for several breweries at once.
+
+        Distinct queries are embedded in one embeddings request, and those
+        without a brewery name are searched with a single FAISS call over the
+        (nq, d) matrix; each result is then validated like search_cache.
+
+        Args:
+            queries: Search queries (brewery names or URLs)
+            brewery_names: Optional brewery names for filtering, one per query
+            top_k: Number of results to retrieve per query
+
+        Returns:
+            List of (result_dict, status) tuples, in the same order as queries
+        """
+        if not queries:
+            return []
+        brewery_names = brewery_names or [None] * len(queries)
+        candidates = [self._candidate_ids(name) for name in brewery_names]
+        # Names with no entries need no vector; repeated queries are embedded once
+        unique_queries = list(
+            dict.fromkeys(q for q, ids in zip(queries, candidates) if ids != [])
+        )
+        unrestricted = list(
+            dict.fromkeys(q for q, ids in zip(queries, candidates) if ids is None)
+        )
+
+        try:
+            vectors = dict(zip(unique_queries, self._embed_queries(unique_queries)))
+        except Exception as e:
+            logger.error(f"Batch cache search failed: {e}")
+            return [(None, "CACHE_MISS")] * len(queries)
+
+        # A concurrent save may renumber ids: resolve and search under one lock
+        with self._index_lock:
+            candidates = [self._candidate_ids(name) for name in brewery_names]
+            rows = {}
+            if unrestricted:
+                try:
+                    _, indices = self.vectorstore.index.search(
+                        np.asarray(
+                            [vectors[q] for q in unrestricted], dtype=np.float32
+                        ),
+                        self._search_k(top_k),
                     )
-                    return None, "CACHE_MISS"
-
-            # Check TTL
-            creation_date = metadata.get("creation_date")
-            if not creation_date:
-                logger.warning("No creation_date in metadata, treating as stale")
-                return None, "CACHE_STALE"
-
-            if not self._is_cache_valid(creation_date):
-                logger.info(f"Cache stale for: {metadata.get('brewery_name')}")
-                result = {
-                    "brewery_name": metadata.get("brewery_name"),
-                    "url": metadata.get("url"),
-                    "summary": top_doc.page_content,
-                    "brewery_type": metadata.get("brewery_type"),
-                    "creation_date": creation_date,
-                }
-                return result, "CACHE_STALE"
-
-            # Cache hit - return valid data
-            logger.info(f"Cache hit for: {metadata.get('brewery_name')}")
+                    rows = dict(zip(unrestricted, indices))
+                except Exception as e:
+                    logger.error(f"Batch cache search failed: {e}")
+                    return [(None, "CACHE_MISS")] * len(queries)
+
+            results = []
+            for query, ids in zip(queries, candidates):
+                # Not embedded: the name had no entries before the lock was taken
+                if ids == [] or query not in vectors:
+                    results.append((None, "CACHE_MISS"))
+                    continue
+                try:
+                    docs = self._nearest_docs(
+                        vectors[query], ids, top_k, row=rows.get(query)
+                    )
+                    results.append(self._cache_result(docs, query))
+                except Exception as e:
+                    logger.error(f"Cache search failed: {e}")
+                    results.append((None, "CACHE_MISS"))
+        return results
+
+    def _candidate_ids(self, brewery_name: Optional[str]) -> Optional[List[int]]:
+        """
+        Return the FAISS ids cached under names containing brewery_name.
+
+        Matching is by containment on normalized names, as before the name
+        index existed: "Stone" also finds entries cached as "Stone Brewing".
+
+        Args:
+            brewery_name: Optional brewery name
+
+        Returns:
+            None without a brewery name (search everything), else the ids,
+            possibly an empty list
+        """
+        key = _name_key(brewery_name) if brewery_name else ""
+        if not key:
+            return None
+        return [
+            faiss_id
+            for name, ids in self._name_ids.items()
+            if key in name
+            for faiss_id in ids
+        ]
+
+    def _nearest_docs(
+        self,
+        vector: List[float],
+        ids: Optional[List[int]],
+        top_k: int,
+        row: Optional[np.ndarray] = None,
+    ) -> List[Document]:
+        """
+        Return the cached documents nearest to a query vector, best first.
+
+        With candidate ids, only those are ranked, by exact distance to their
+        stored vectors, so a different brewery can never be returned.
+        Approximate indexes cannot be trusted to reach a handful of allowed ids
+        through an IDSelector, which is why the few candidates are compared
+        directly. Otherwise the whole index is searched.
+
+        Args:
+            vector: Query embedding
+            ids: FAISS ids to restrict the search to, or None for all
+            top_k: Number of documents to return
+            row: FAISS search result for vector, if already computed
+
+        Returns:
+            Up to top_k documents
+        """
+        if ids is not None:
+            candidates = np.asarray(ids, dtype=np.int64)
+            stored = self.vectorstore.index.reconstruct_batch(candidates)
+            distances = ((stored - np.asarray(vector, dtype=np.float32)) ** 2).sum(1)
+            row = candidates[np.argsort(distances)[:top_k]]
+        elif row is None:
+            with _omp_threads(1):
+                _, indices = self.vectorstore.index.search(
+                    np.asarray([vector], dtype=np.float32), self._search_k(top_k)
+                )
+            row = indices[0]
+
+        docstore = self.vectorstore.docstore
+        index_to_docstore_id = self.vectorstore.index_to_docstore_id
+        # -1 pads missing results; removed entries are no longer mapped
+        return [
+            docstore.search(index_to_docstore_id[int(i)])
+            for i in row
+            if int(i) in index_to_docstore_id
+        ][:top_k]
+
+    def _search_k(self, top_k: int) -> int:
+        """Neighbours to request so top_k remain after skipping removed entries."""
+        removed = self.vectorstore.index.ntotal - len(
+            self.vectorstore.index_to_docstore_id
+        )
+        return top_k + removed
+
+    def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embed search queries, reusing the vectors of recently seen queries.
+
+        Queries are matched case- and whitespace-insensitively. The misses are
+        embedded in one request, with the same task type as embed_query.
+
+        Args:
+            queries: Search queries
+
+        Returns:
+            One embedding vector per query
+        """
+        keys = [query.strip().lower() for query in queries]
+        vectors = [self._query_vectors.get(key) for key in keys]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fresh = self.embeddings.embed_documents(
+                [queries[i] for i in missing],
+                task_type=self.embeddings.task_type or "RETRIEVAL_QUERY",
+            )
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector
+                self._query_vectors.set(keys[i], vector)
+        return vectors
+
+    def _cache_result(
+        self, docs: List[Document], query: str
+    ) -> Tuple[Optional[Dict], str]:
+        """
+        Turn the documents found for a query into a (result_dict, status) tuple.
+
+        Args:
+            docs: Documents returned by the similarity search, best first
+            query: Search query (for logging)
+
+        Returns:
+            Tuple of (result_dict, status), see search_cache
+        """
+        if not docs:
+            logger.info(f"Cache miss for query: {query}")
+            return None, "CACHE_MISS"
+
+        # Get the top result
+        top_doc = docs[0]
+        metadata = top_doc.metadata
+
+        # Check TTL
+        creation_date = metadata.get("creation_date")
+        if not creation_date:
+            logger.warning("No creation_date in metadata, treating as stale")
+            return None, "CACHE_STALE"
+
+        if not self._is_cache_valid(creation_date, metadata.get("creation_ts")):
+            logger.info(f"Cache stale for: {metadata.get('brewery_name')}")
             result = {
                 "brewery_name": metadata.get("brewery_name"),
                 "url": metadata.get("url"),
@@ -184,11 +674,18 @@ class RAGManager:
                 "brewery_type": metadata.get("brewery_type"),
                 "creation_date": creation_date,
             }
-            return result, "CACHE_HIT"
+            return result, "CACHE_STALE"
 
-        except Exception as e:
-            logger.error(f"Cache search failed: {e}")
-            return None, "CACHE_MISS"
+        # Cache hit - return valid data
+        logger.info(f"Cache hit for: {metadata.get('brewery_name')}")
+        result = {
+            "brewery_name": metadata.get("brewery_name"),
+            "url": metadata.get("url"),
+            "summary": top_doc.page_content,
+            "brewery_type": metadata.get("brewery_type"),
+            "creation_date": creation_date,
+        }
+        return result, "CACHE_HIT"
 
     def add_to_cache(
         self, brewery_name: str, url: str, summary: str, brewery_type: str = "unknown"
@@ -202,24 +699,66 @@ class RAGManager:
             summary: Content summary (3 sentences max)
             brewery_type: Type of brewery (micro, brewpub, etc.)
 
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._add_entry(brewery_name, url, summary, brewery_type)
+
+    def _add_entry(
+        self,
+        brewery_name: str,
+        url: str,
+        summary: str,
+        brewery_type: str,
+        replace: bool = False,
+    ) -> bool:
+        """
+        Add a cache entry, optionally replacing the brewery's existing entries.
+
+        Replaced entries leave the docstore right away; their vectors stay in
+        the index, unreachable, until the next save compacts it.
+
+        Args:
+            brewery_name: Name of the brewery
+            url: Website URL
+            summary: Content summary
+            brewery_type: Type of brewery
+            replace: Remove the entries already cached under brewery_name
+
         Returns:
             True if successful, False otherwise
         """
         try:
             # Create document with metadata
             doc = Document(
+                id=str(uuid.uuid4()),
                 page_content=summary,
                 metadata={
                     "brewery_name": brewery_name,
                     "url": url,
                     "brewery_type": brewery_type,
                     "creation_date": datetime.now().isoformat(),
+                    "creation_ts": int(time.time()),
                     "type": "brewery_summary",
                 },
             )
 
-            # Add to vectorstore
-            self.vectorstore.add_documents([doc])
+            vector = self.embeddings.embed_documents([summary])
+
+            # Add to vectorstore (appended: its FAISS id is the previous size).
+            # Mapped by hand: FAISS.add_documents numbers new entries from
+            # len(index_to_docstore_id), which removed entries make too small
+            with self._index_lock:
+                faiss_id = self.vectorstore.index.ntotal
+                self._writable_index().add(np.asarray(vector, dtype=np.float32))
+                self.vectorstore.docstore.add({doc.id: doc})
+                self.vectorstore.index_to_docstore_id[faiss_id] = doc.id
+                key = _name_key(brewery_name)
+                if replace:
+                    self._remove_entries(self._name_ids.pop(key, []))
+                self._name_ids.setdefault(key, []).append(faiss_id)
+            self.mark_dirty()
+            self.flush()
             logger.info(f"Added to cache: {brewery_name} ({url})")
 
             return True
@@ -232,11 +771,7 @@ class RAGManager:
         self, brewery_name: str, url: str, summary: str, brewery_type: str = "unknown"
     ) -> bool:
         """
-        Update existing cache entry with new summary.
-
-        Note: FAISS doesn't support in-place updates, so we add a new entry
-        with updated timestamp. Old entry will naturally become less relevant
-        due to lower similarity scores.
+        Replace the cached entries of a brewery with a new summary.
 
         Args:
             brewery_name: Name of the brewery
@@ -248,7 +783,108 @@ class RAGManager:
             True if successful, False otherwise
         """
         logger.info(f"Updating cache entry for: {brewery_name}")
-        return self.add_to_cache(brewery_name, url, summary, brewery_type)
+        return self._add_entry(brewery_name, url, summary, brewery_type, replace=True)
+
+    def submit_to_cache(
+        self,
+        brewery_name: str,
+        url: str,
+        summary: str,
+        brewery_type: str = "unknown",
+        replace: bool = False,
+    ) -> "Future[bool]":
+        """
+        Add or replace a cache entry in a background thread.
+
+        The caller does not wait for the embedding request; several submitted
+        entries are embedded in parallel. flush(force=True) waits for them.
+
+        Args:
+            brewery_name: Name of the brewery
+            url: Website URL
+            summary: Content summary
+            brewery_type: Type of brewery
+            replace: Replace the brewery's entries, like update_cache_entry
+
+        Returns:
+            Future resolving to the add_to_cache/update_cache_entry result
+        """
+        return self.submit_task(
+            self._add_entry, brewery_name, url, summary, brewery_type, replace
+        )
+
+    def submit_task(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """
+        Run fn(*args) in the manager's background threads.
+
+        flush(force=True) and close() wait for submitted tasks, so work that
+        ends in a cache update is not lost when the caller finishes first.
+
+        Args:
+            fn: Function to run
+            *args: Its arguments
+
+        Returns:
+            Future of fn's result
+        """
+        future = self._add_pool.submit(fn, *args)
+        with self._pending_lock:
+            self._pending_tasks.add(future)
+        # Runs right away if the task already finished
+        future.add_done_callback(self._task_done)
+        return future
+
+    def _task_done(self, future: Future) -> None:
+        """Forget a finished background task."""
+        with self._pending_lock:
+            self._pending_tasks.discard(future)
+
+    def _wait_for_tasks(self) -> None:
+        """Wait for background tasks, including any they submit in turn."""
+        while True:
+            with self._pending_lock:
+                pending = list(self._pending_tasks)
+            if not pending:
+                return
+            wait(pending)
+
+    def _remove_entries(self, ids: List[int]) -> None:
+        """
+        Drop entries from the docstore and the FAISS id mapping.
+
+        The HNSW index cannot delete vectors, so they stay in place, skipped by
+        searches, until _compact_index rebuilds the index.
+
+        Args:
+            ids: FAISS ids of the entries
+        """
+        if not ids:
+            return
+        index_to_docstore_id = self.vectorstore.index_to_docstore_id
+        self.vectorstore.docstore.delete([index_to_docstore_id.pop(i) for i in ids])
+
+    def _compact_index(self) -> None:
+        """Rebuild the index without the vectors of removed entries, if any."""
+        index = self.vectorstore.index
+        mapping = self.vectorstore.index_to_docstore_id
+        if len(mapping) == index.ntotal:
+            return
+
+        live = sorted(mapping)
+        # Same type and parameters; IVF keeps its trained quantizer and codebooks
+        compacted = faiss.clone_index(index)
+        compacted.reset()
+        if live:
+            compacted.add(index.reconstruct_batch(np.asarray(live, dtype=np.int64)))
+        if isinstance(compacted, faiss.IndexIVF):
+            compacted.make_direct_map()
+        logger.info(f"Compacted FAISS index: {index.ntotal} -> {compacted.ntotal}")
+
+        self.vectorstore.index = compacted
+        self.vectorstore.index_to_docstore_id = {
+            new_id: mapping[old_id] for new_id, old_id in enumerate(live)
+        }
+        self._name_ids = self._build_name_index()
 
     def save_index(self) -> bool:
         """
@@ -258,13 +894,62 @@ class RAGManager:
             True if successful, False otherwise
         """
         try:
-            self.vectorstore.save_local(str(self.index_path))
-            logger.info(f"Saved FAISS index to {self.index_path}")
+            with self._index_lock:
+                # Writing over the file of a mapped index would corrupt the mapping
+                self._writable_index()
+                self._compact_index()
+                self.vectorstore.save_local(self._index_dir)
+            logger.info(f"Saved FAISS index to {self._index_dir}")
             return True
         except Exception as e:
             logger.error(f"Failed to save index: {e}")
             return False
 
+    def mark_dirty(self) -> None:
+        """Record a change to the in-memory index that is not yet saved to disk."""
+        with self._flush_lock:
+            self._dirty += 1
+
+    def flush(self, force: bool = False) -> bool:
+        """
+        Persist the index if it has unsaved changes.
+
+        Without force, the index is only written once FLUSH_MAX_PENDING changes
+        have accumulated or FLUSH_INTERVAL seconds have passed since the last
+        write, so a burst of cache updates costs one index serialization instead
+        of one each. Pending changes are also written when the interpreter exits.
+
+        Args:
+            force: Write now regardless of the pending count and last write
+                time, after waiting for tasks queued by submit_task (never
+                call it with force from such a task)
+
+        Returns:
+            True if the index is saved or nothing needed saving, False if saving failed
+        """
+        if force:
+            self._wait_for_tasks()
+        with self._flush_lock:
+            if not self._dirty:
+                return True
+            if (
+                not force
+                and self._dirty < self.FLUSH_MAX_PENDING
+                and time.monotonic() - self._last_flush < self.FLUSH_INTERVAL
+            ):
+                return True
+            if not self.save_index():
+                return False
+            self._dirty = 0
+            self._last_flush = time.monotonic()
+            return True
+
+    def close(self) -> None:
+        """Wait for background tasks, write pending changes and stop the threads."""
+        self.flush(force=True)
+        self._add_pool.shutdown(wait=True)
+        _OPEN_MANAGERS.discard(self)
+
     def get_cache_stats(self) -> Dict:
         """
         Get statistics about the cache.
@@ -273,31 +958,31 @@ class RAGManager:
             Dictionary with cache statistics
         """
         try:
-            # Get all documents (FAISS doesn't have a direct method for this)
-            # So we'll use a broad search to estimate
-            all_docs = self.vectorstore.similarity_search("brewery", k=100)
-
-            total_entries = len(
-                [d for d in all_docs if d.metadata.get("type") == "brewery_summary"]
-            )
+            # Walk every indexed document; no embedding call or vector search
+            docstore = self.vectorstore.docstore
+            with self._index_lock:
+                all_docs = [
+                    docstore.search(doc_id)
+                    for doc_id in self.vectorstore.index_to_docstore_id.values()
+                ]
 
-            valid_entries = 0
-            stale_entries = 0
-
-            for doc in all_docs:
-                if doc.metadata.get("type") == "brewery_summary":
-                    creation_date = doc.metadata.get("creation_date")
-                    if creation_date and self._is_cache_valid(creation_date):
-                        valid_entries += 1
-                    else:
-                        stale_entries += 1
+            summaries = [
+                doc.metadata
+                for doc in all_docs
+                if doc.metadata.get("type") == "brewery_summary"
+            ]
+            creation_dates = [metadata.get("creation_date") for metadata in summaries]
+            creation_ts = [metadata.get("creation_ts") for metadata in summaries]
+            total_entries = len(creation_dates)
+            valid_entries = int(self._bulk_validity(creation_dates, creation_ts).sum())
+            stale_entries = total_entries - valid_entries
 
             return {
                 "total_entries": total_entries,
                 "valid_entries": valid_entries,
                 "stale_entries": stale_entries,
                 "ttl_days": self.ttl_days,
-                "index_path": str(self.index_path),
+                "index_path": self._index_dir,
             }
 
         except Exception as e:
@@ -307,5 +992,118 @@ class RAGManager:
                 "valid_entries": 0,
                 "stale_entries": 0,
                 "ttl_days": self.ttl_days,
-                "index_path": str(self.index_path),
+                "index_path": self._index_dir,
             }
+
+
+class _DeferredEmbeddings(Embeddings):
+    """Embeddings that create RAGManager.embeddings only when first used."""
+
+    def __init__(self, manager: RAGManager):
+        self._manager = weakref.ref(manager)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._manager().embeddings.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._manager().embeddings.embed_query(text)
+
+
+# Managers not closed yet; their pending changes are written at exit
+_OPEN_MANAGERS: "weakref.WeakSet[RAGManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    """Write the pending changes of every open RAGManager at exit."""
+    for manager in list(_OPEN_MANAGERS):
+        manager.flush(force=True)
+
+
+class BatchingSearcher:
+    """
+    Coalesces concurrent cache lookups from async code into batched searches.
+
+    Lookups submitted within flush_ms of the first pending one (up to max_batch)
+    are answered by a single RAGManager.search_cache_batch call, i.e. one
+    embeddings request and one FAISS search instead of one of each per query.
+    A lone lookup therefore waits up to flush_ms; use search_cache directly
+    for serial callers.
+    """
+
+    def __init__(
+        self, rag_manager: RAGManager, max_batch: int = 32, flush_ms: float = 50
+    ):
+        """
+        Initialize the searcher.
+
+        Args:
+            rag_manager: Cache to search
+            max_batch: Maximum number of lookups per batched search
+            flush_ms: How long to wait for more lookups after the first one
+        """
+        self.rag_manager = rag_manager
+        self.max_batch = max_batch
+        self.flush_ms = flush_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(
+        self, query: str, brewery_name: Optional[str] = None
+    ) -> Tuple[Optional[Dict], str]:
+        """
+        Search the cache as part of the next batch.
+
+        Args:
+            query: Search query (brewery name or URL)
+            brewery_name: Optional brewery name for filtering
+
+        Returns:
+            Tuple of (result_dict, status), see RAGManager.search_cache
+        """
+        # The queue and worker belong to the running event loop
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._flush_loop())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((query, brewery_name, future))
+        return await future
+
+    async def _flush_loop(self) -> None:
+        """Collect pending lookups into batches and resolve their futures."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_ms / 1000
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            queries = [query for query, _, _ in batch]
+            brewery_names = [brewery_name for _, brewery_name, _ in batch]
+            try:
+                results = await asyncio.to_thread(
+                    self.rag_manager.search_cache_batch, queries, brewery_names
+                )
+            except Exception as e:
+                logger.error(f"Batched cache search failed: {e}")
+                results = [(None, "CACHE_MISS")] * len(batch)
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop the background batching task."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
@@ -0,0 +1,186 @@
+"""
+In-process semantic cache for LLM outputs.
+
+Stores values under the embedding of the text that produced them and returns a
+cached value when a new text is similar enough (cosine similarity above a
+threshold), so paraphrased questions can skip the LLM call.
+
+Vectors are L2-normalized and kept in FAISS inner-product indexes, so the inner
+product is the cosine similarity. Entries are scoped (e.g. per client), each
+scope with its own index, and the cache is bounded with LRU eviction. Two texts
+that differ in their literals (numbers, quoted strings, proper nouns such as
+"Ohio" and "Oregon") never share a value, however close their embeddings are.
+"""
+
+import itertools
+import re
+import threading
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+
+from .ttl_cache import TTLCache
+
+# Numbers, quoted strings, and capitalized words that do not start a sentence
+_LITERAL_RE = re.compile(
+    r"\d+(?:[.,]\d+)*|(?<!\w)'[^']*'(?!\w)|\"[^\"]*\""
+    r"|(?<![.!?]\s)(?<!^)\b[A-Z][\w-]+"
+)
+
+
+def extract_literals(text: str) -> FrozenSet[str]:
+    """
+    Return the literals of a text: the parts a paraphrase must keep verbatim.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        Lowercased numbers, quoted strings and proper nouns found in text
+    """
+    return frozenset(
+        match.strip("'\"").lower() for match in _LITERAL_RE.findall(text.strip())
+    )
+
+
+class SemanticCache:
+    """
+    Thread-safe, size-bounded cache keyed by text embeddings.
+
+    Lookups only search entries stored under the same scope, so context that is
+    specific to one user never answers another user's question, and other
+    users' entries cannot crowd the right one out of the neighbours inspected.
+    """
+
+    # Neighbours inspected per lookup; near paraphrases with different
+    # literals may rank first
+    SEARCH_K = 8
+
+    # Recent text vectors: a miss is usually followed by set() for the same
+    # text, which must not cost a second embedding request
+    VECTOR_CACHE_SIZE = 256
+    VECTOR_CACHE_TTL = 600
+
+    def __init__(
+        self,
+        embed: Callable[[str], Sequence[float]],
+        threshold: float = 0.95,
+        maxsize: int = 10000,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed: Function returning the embedding vector of a text
+            threshold: Minimum cosine similarity for a cache hit
+            maxsize: Maximum number of entries before the least recently used is evicted
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._indexes: Dict[Hashable, Any] = {}
+        # entry id -> (scope, literals of the stored text, value)
+        self._entries: "OrderedDict[int, Tuple[Hashable, FrozenSet[str], Any]]" = (
+            OrderedDict()
+        )
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._vectors = TTLCache(
+            maxsize=self.VECTOR_CACHE_SIZE, ttl=self.VECTOR_CACHE_TTL
+        )
+
+    def _vector(self, text: str) -> np.ndarray:
+        """Embed text as a normalized float32 row vector (memoized per text)."""
+        vector = self._vectors.get(text)
+        if vector is None:
+            vector = np.asarray(self.embed(text), dtype=np.float32).reshape(1, -1)
+            norm = np.linalg.norm(vector)
+            if norm:
+                vector = vector / norm
+            self._vectors.set(text, vector)
+        return vector
+
+    def get(self, text: str, scope: Hashable = None) -> Optional[Any]:
+        """
+        Return the value cached for the most similar text in scope, if similar enough.
+
+        Args:
+            text: Text to look up
+            scope: Scope the entry must belong to
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        if scope not in self._indexes:
+            return None
+
+        vector = self._vector(text)
+        literals = extract_literals(text)
+        with self._lock:
+            index = self._indexes.get(scope)
+            if index is None:
+                return None
+
+            scores, ids = index.search(vector, min(self.SEARCH_K, index.ntotal))
+            for score, entry_id in zip(scores[0], ids[0]):
+                if score < self.threshold:
+                    break
+                entry = self._entries.get(int(entry_id))
+                if entry is not None and entry[1] == literals:
+                    self._entries.move_to_end(int(entry_id))
+                    return entry[2]
+        return None
+
+    def set(self, text: str, value: Any, scope: Hashable = None) -> None:
+        """
+        Store value under the embedding of text.
+
+        Args:
+            text: Text that produced the value
+            value: Value to cache
+            scope: Scope the entry belongs to
+        """
+        vector = self._vector(text)
+        literals = extract_literals(text)
+        with self._lock:
+            index = self._indexes.get(scope)
+            if index is None:
+                import faiss
+
+                index = faiss.IndexIDMap2(faiss.IndexFlatIP(vector.shape[1]))
+                self._indexes[scope] = index
+
+            entry_id = next(self._ids)
+            index.add_with_ids(vector, np.array([entry_id], dtype=np.int64))
+            self._entries[entry_id] = (scope, literals, value)
+
+            evicted: Dict[Hashable, List[int]] = {}
+            while len(self._entries) > self.maxsize:
+                evicted_id, (evicted_scope, _, _) = self._entries.popitem(last=False)
+                evicted.setdefault(evicted_scope, []).append(evicted_id)
+            for evicted_scope, ids in evicted.items():
+                scope_index = self._indexes[evicted_scope]
+                scope_index.remove_ids(np.array(ids, dtype=np.int64))
+                if scope_index.ntotal == 0:
+                    del self._indexes[evicted_scope]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._indexes.clear()
+        self._vectors.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)